@@ -0,0 +1,28 @@
+"""
+Response Classes for Aadhaar Pulse API
+
+orjson-backed JSON response used as the application's default
+response class.
+"""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from app.services.json_io import json_dumps
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response serialized with orjson.
+    
+    orjson encodes straight to UTF-8 bytes and handles datetimes, enums,
+    NumPy scalars and arrays natively. NaN and Infinity are emitted as
+    null, so model dumps can be returned as-is without sanitize_for_json
+    or FastAPI's jsonable_encoder pass.
+    """
+    
+    media_type = "application/json"
+    
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content)
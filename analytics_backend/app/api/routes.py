@@ -10,14 +10,13 @@ Provides RESTful endpoints for:
 
 import uuid
 import math
-import json
 import tempfile
 import os
-from datetime import datetime
 from typing import Any, Dict, List, Optional
 from pathlib import Path
+import numpy as np
 from fastapi import APIRouter, File, UploadFile, HTTPException, BackgroundTasks, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from loguru import logger
 
 from app.models import (
@@ -26,8 +25,12 @@ from app.models import (
     AnalysisPackage,
     AnalysisStatus,
     HealthCheckResponse,
-    FileUploadResponse
+    ComponentHealth,
+    FileUploadResponse,
+    utc_now
 )
+from app.api.responses import ORJSONResponse
+from app.services.json_io import json_dumps, json_loads
 from app.services.orchestrator import AnalysisOrchestrator
 from app.config import settings
 
@@ -38,7 +41,8 @@ def sanitize_for_json(obj: Any) -> Any:
     """
     Recursively sanitize an object for JSON serialization.
     Replaces NaN, Inf, -Inf with None.
-    Handles datetime objects.
+    Handles datetime objects and NumPy arrays/scalars, which the
+    orjson response path serializes natively but stdlib json does not.
     """
     from datetime import datetime, date
     
@@ -46,6 +50,10 @@ def sanitize_for_json(obj: Any) -> Any:
         return {k: sanitize_for_json(v) for k, v in obj.items()}
     elif isinstance(obj, list):
         return [sanitize_for_json(item) for item in obj]
+    elif isinstance(obj, np.ndarray):
+        return sanitize_for_json(obj.tolist())
+    elif isinstance(obj, np.generic):
+        return sanitize_for_json(obj.item())
     elif isinstance(obj, (datetime, date)):
         return obj.isoformat()
     elif isinstance(obj, float):
@@ -72,16 +80,18 @@ async def health_check():
         settings.anthropic_api_key or 
         settings.huggingface_api_key
     )
-    return HealthCheckResponse(
+    health = HealthCheckResponse(
         status="healthy",
-        timestamp=datetime.utcnow(),
+        timestamp=utc_now(),
         version="1.0.0",
-        components={
-            "api": "operational",
-            "analytics": "operational",
-            "llm": "configured" if llm_configured else "not_configured"
-        }
+        components=ComponentHealth(
+            api="operational",
+            analytics="operational",
+            llm="configured" if llm_configured else "not_configured"
+        )
     )
+    # Returning a Response skips response_model re-validation and jsonable_encoder
+    return ORJSONResponse(health.model_dump())
 
 
 @router.post("/upload", response_model=FileUploadResponse)
@@ -89,7 +99,7 @@ async def upload_file(file: UploadFile = File(...)):
     """
     Upload a data file for analysis.
     
-    Supports CSV, JSON, and Excel files up to configured size limit.
+    Supports CSV, JSON, Excel and Parquet files up to configured size limit.
     Returns data quality report and job ID for subsequent analysis.
     """
     # Validate file type
@@ -132,7 +142,7 @@ async def upload_file(file: UploadFile = File(...)):
         # Initialize job status
         analysis_jobs[response.job_id] = {
             "status": AnalysisStatus.PENDING,
-            "created_at": datetime.utcnow(),
+            "created_at": utc_now(),
             "filename": filename,
             "progress": 0,
             "result": None,
@@ -184,7 +194,7 @@ async def trigger_analysis(
             if job_id not in analysis_jobs:
                 analysis_jobs[job_id] = {
                     "status": AnalysisStatus.PENDING,
-                    "created_at": datetime.utcnow(),
+                    "created_at": utc_now(),
                     "filename": filename,
                     "progress": 0,
                     "result": None,
@@ -222,20 +232,17 @@ async def trigger_analysis(
         analysis_jobs[job_id]["status"] = AnalysisStatus.COMPLETED
         analysis_jobs[job_id]["progress"] = 100
         analysis_jobs[job_id]["result"] = result
-        analysis_jobs[job_id]["completed_at"] = datetime.utcnow()
+        analysis_jobs[job_id]["completed_at"] = utc_now()
         
         logger.info(f"Analysis completed for job {job_id}")
         
-        # Return results directly in response
-        result_dict = result.model_dump()
-        sanitized_result = sanitize_for_json(result_dict)
-        
-        return {
+        # Return results directly in response; orjson maps NaN/Inf to null
+        return ORJSONResponse({
             "success": True,
             "job_id": job_id,
             "message": "Analysis completed",
-            "results": sanitized_result
-        }
+            "results": result.model_dump()
+        })
         
     except Exception as e:
         logger.error(f"Analysis failed for job {job_id}: {e}")
@@ -273,7 +280,7 @@ async def run_analysis_task(
         analysis_jobs[job_id]["status"] = AnalysisStatus.COMPLETED
         analysis_jobs[job_id]["progress"] = 100
         analysis_jobs[job_id]["result"] = result
-        analysis_jobs[job_id]["completed_at"] = datetime.utcnow()
+        analysis_jobs[job_id]["completed_at"] = utc_now()
         
         logger.info(f"Analysis completed for job {job_id}")
         
@@ -293,13 +300,14 @@ async def get_analysis_status(job_id: str):
     
     job = analysis_jobs[job_id]
     
-    return AnalysisStatusResponse(
+    status = AnalysisStatusResponse(
         job_id=job_id,
         status=job["status"],
         progress=job["progress"],
         current_stage="Analysis" if job["status"] == AnalysisStatus.PROCESSING else job["status"].value,
         errors=[job["error"]] if job.get("error") else []
     )
+    return ORJSONResponse(status.model_dump())
 
 
 @router.get("/results/{job_id}")
@@ -324,11 +332,10 @@ async def get_analysis_results(job_id: str):
     if job["result"] is None:
         raise HTTPException(status_code=404, detail="No results available")
     
-    # Convert to dict for JSON serialization and sanitize NaN/Inf values
+    # Serialize fully before responding (NaN/Inf become null), skipping jsonable_encoder,
+    # so an encoding error is a 500 rather than a truncated 200
     result: AnalysisPackage = job["result"]
-    result_dict = result.model_dump()
-    sanitized_result = sanitize_for_json(result_dict)
-    return sanitized_result
+    return Response(content=result.to_json(), media_type="application/json")
 
 
 @router.get("/insights/{job_id}")
@@ -348,7 +355,7 @@ async def get_insights_only(job_id: str):
     
     result: AnalysisPackage = job["result"]
     
-    return {
+    return ORJSONResponse({
         "job_id": job_id,
         "executive_summary": result.intelligence_report.executive_summary,
         "root_causes": result.intelligence_report.root_cause_analysis,
@@ -362,7 +369,7 @@ async def get_insights_only(job_id: str):
         ],
         "risk_assessment": result.intelligence_report.risk_assessment,
         "confidence": result.intelligence_report.confidence_score
-    }
+    })
 
 
 @router.get("/anomalies/{job_id}")
@@ -399,11 +406,11 @@ async def get_anomalies(
     # Limit results
     anomalies = anomalies[:limit]
     
-    return {
+    return ORJSONResponse({
         "job_id": job_id,
         "total_anomalies": len(anomalies),
         "anomalies": [a.model_dump() for a in anomalies]
-    }
+    })
 
 
 @router.get("/correlations/{job_id}")
@@ -432,11 +439,11 @@ async def get_correlations(
         if abs(c.correlation_coefficient) >= min_correlation
     ][:limit]
     
-    return {
+    return ORJSONResponse({
         "job_id": job_id,
         "correlations": [c.model_dump() for c in strong_corrs],
         "driver_variables": correlations.driver_variables[:10]
-    }
+    })
 
 
 @router.get("/volatility/{job_id}")
@@ -455,13 +462,13 @@ async def get_volatility(job_id: str):
     result: AnalysisPackage = job["result"]
     volatility = result.statistical_abstract.volatility_findings
     
-    return {
+    return ORJSONResponse({
         "job_id": job_id,
         "high_volatility_regions": volatility.high_volatility_regions,
         "stable_regions": volatility.stable_regions,
         "seasonality_detected": volatility.seasonality_detected,
         "regional_scores": [r.model_dump() for r in volatility.regional_scores[:20]]
-    }
+    })
 
 
 @router.get("/visualizations/{job_id}")
@@ -482,10 +489,12 @@ async def get_visualizations(job_id: str):
     
     result: AnalysisPackage = job["result"]
     
-    return {
-        "job_id": job_id,
-        "visualizations": [v.model_dump() for v in result.visualizations]
-    }
+    content = b''.join((
+        b'{"job_id":', json_dumps(job_id), b',"visualizations":[',
+        b','.join(spec.to_json() for spec in result.visualizations),
+        b']}'
+    ))
+    return Response(content=content, media_type="application/json")
 
 
 @router.delete("/jobs/{job_id}")
@@ -559,20 +568,18 @@ async def export_report(
             result_dict = result
         else:
             # If it's some other type, try to convert to dict
-            import json
-            result_dict = json.loads(json.dumps(result, default=str))
-        
-        # Sanitize results for JSON
-        sanitized_results = sanitize_for_json(result_dict)
+            result_dict = json_loads(json_dumps(result, stringify_unknown=True))
     except Exception as e:
         logger.error(f"Error converting result to dict: {e}")
         raise HTTPException(status_code=500, detail=f"Error preparing export: {str(e)}")
     
     if format == "json":
+        # orjson encodes NaN/Inf as null and NumPy/datetime values natively,
+        # so the dump goes straight out without a sanitize_for_json walk;
+        # any other unsupported value is stringified as before
         from fastapi.responses import Response
-        import json
         return Response(
-            content=json.dumps(sanitized_results, indent=2),
+            content=json_dumps(result_dict, indent=True, stringify_unknown=True),
             media_type="application/json",
             headers={
                 "Content-Disposition": f"attachment; filename=aadhaar_pulse_report_{job_id}.json"
@@ -580,6 +587,7 @@ async def export_report(
         )
     elif format == "csv":
         # CSV export of key findings
+        sanitized_results = sanitize_for_json(result_dict)
         import csv
         from io import StringIO
         
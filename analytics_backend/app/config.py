@@ -33,6 +33,18 @@ class Settings(BaseSettings):
         default=["*"]
     )
     
+    # Response Compression
+    gzip_compression_level: int = Field(
+        default=5,
+        ge=1,
+        le=9,
+        description="Gzip level for API responses (9 is smallest but most CPU-intensive)"
+    )
+    gzip_minimum_size: int = Field(
+        default=1000,
+        description="Minimum response size in bytes before compressing"
+    )
+    
     # Database
     database_url: str = Field(default="sqlite:///./aadhaar_pulse.db")
     
@@ -56,7 +68,7 @@ class Settings(BaseSettings):
     # File Upload Configuration
     max_upload_size_mb: int = Field(default=100)
     allowed_extensions: List[str] = Field(
-        default=["csv", "json", "xlsx", "xls"]
+        default=["csv", "json", "xlsx", "xls", "parquet"]
     )
     
     # Analysis Configuration
@@ -81,11 +93,97 @@ class Settings(BaseSettings):
         description="P-value threshold for statistical significance"
     )
     
+    # Engine Execution
+    max_concurrent_engine_runs: int = Field(
+        default=2,
+        gt=0,
+        description="Analyses allowed to run their engines in parallel at once"
+    )
+    
+    # Analysis Result Cache
+    analysis_cache_mode: Literal["enabled", "disabled"] = Field(
+        default="enabled",
+        description="Reuse packages for repeated analysis requests on the same upload"
+    )
+    analysis_cache_ttl_seconds: int = Field(
+        default=900,
+        description="Seconds a cached analysis package stays valid"
+    )
+    
+    # LLM Response Cache
+    llm_cache_mode: Literal["enabled", "read_only", "write_only", "replay", "disabled"] = Field(
+        default="enabled",
+        description="How LLM responses are reused across identical prompts"
+    )
+    llm_cache_path: str = Field(default="llm_cache.sqlite3")
+    llm_cache_ttl_seconds: int = Field(
+        default=86400,
+        description="Seconds a cached LLM response stays valid (0 = never expires)"
+    )
+    llm_cache_number_digits: int = Field(
+        default=0,
+        ge=0,
+        description="Significant digits kept for decimals in cache keys (0 = exact match)"
+    )
+    
+    # LLM Rate Limiting (provider quota, split across worker processes)
+    llm_requests_per_minute: int = Field(default=60, gt=0)
+    llm_tokens_per_minute: int = Field(default=100000, gt=0)
+    llm_max_concurrent_requests: int = Field(
+        default=4,
+        gt=0,
+        description="Provider calls allowed in flight at once per process"
+    )
+    llm_rate_limit_workers: int = Field(
+        default=1,
+        description="Number of server processes sharing the provider quota"
+    )
+    
+    # LLM HTTP Connection Pool
+    llm_http_max_connections: int = Field(default=50, gt=0)
+    llm_http_max_keepalive_connections: int = Field(default=20, ge=0)
+    llm_http_keepalive_expiry_seconds: float = Field(
+        default=60.0,
+        description="Seconds an idle provider connection is kept for reuse"
+    )
+    
+    # LLM Retries & Circuit Breaker
+    llm_retry_attempts: int = Field(
+        default=5,
+        gt=0,
+        description="Attempts per provider request on 429/5xx or connection errors"
+    )
+    llm_circuit_failure_threshold: int = Field(
+        default=10,
+        gt=0,
+        description="Consecutive failed calls before provider calls are short-circuited"
+    )
+    llm_circuit_reset_seconds: float = Field(
+        default=30.0,
+        description="Seconds the circuit stays open before a trial call"
+    )
+    
+    # Response Validation
+    validate_responses: bool = Field(
+        default=False,
+        description="Re-validate assembled analysis packages (debugging aid)"
+    )
+    
     # Differential Privacy
     differential_privacy_epsilon: float = Field(
         default=1.0,
         description="Epsilon parameter for differential privacy"
     )
+    differential_privacy_mechanism: Literal["laplace", "gaussian"] = Field(
+        default="laplace",
+        description="Noise distribution applied to LLM scores"
+    )
+    differential_privacy_delta: float = Field(
+        default=1e-5,
+        gt=0,
+        lt=1,
+        description="Delta parameter for the Gaussian mechanism"
+    )
     
     # Logging
     log_level: str = Field(default="INFO")
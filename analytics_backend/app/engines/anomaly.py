@@ -20,7 +20,6 @@ Threshold: |Z| > 2 is flagged as anomalous
 
 import uuid
 from typing import Any, Dict, List, Optional, Tuple
-from collections import defaultdict
 import pandas as pd
 import numpy as np
 from scipy import stats
@@ -37,6 +36,15 @@ from app.models import (
 )
 from app.config import settings
 
+# Severity levels in reporting order; codes index into this tuple
+SEVERITY_LEVELS = (RiskLevel.CRITICAL, RiskLevel.HIGH, RiskLevel.MEDIUM, RiskLevel.LOW)
+SEVERITY_CODES = {level: code for code, level in enumerate(SEVERITY_LEVELS)}
+
+# Ascending bin edges: |Z| > 4 critical, > 3 high, > 2 medium
+ZSCORE_SEVERITY_BINS = np.array([2.0, 3.0, 4.0])
+# Ascending bin edges: Isolation Forest score < -0.5 critical, < -0.3 high, < -0.1 medium
+SCORE_SEVERITY_BINS = np.array([-0.5, -0.3, -0.1])
+
 
 class AnomalyDetectionEngine:
     """
@@ -169,17 +177,18 @@ class AnomalyDetectionEngine:
         if national_std == 0:
             return anomalies
         
-        # Calculate Z-scores
-        df_temp = df.copy()
-        df_temp['_zscore'] = (df[metric_column] - national_mean) / national_std
+        # Calculate Z-scores (float32 is ample for reporting to 4 decimals)
+        values = df[metric_column].to_numpy(dtype=np.float64, na_value=np.nan)
+        z_scores = ((values - national_mean) / national_std).astype(np.float32)
         
         # Find anomalies
-        anomaly_mask = abs(df_temp['_zscore']) > self.zscore_threshold
-        anomaly_rows = df_temp[anomaly_mask]
+        anomaly_mask = np.abs(z_scores) > self.zscore_threshold
+        anomaly_rows = df[anomaly_mask]
+        anomaly_z = z_scores[anomaly_mask]
+        severity_codes = self._severity_codes_from_z(anomaly_z)
         
-        for idx, row in anomaly_rows.iterrows():
+        for (idx, row), z, severity_code in zip(anomaly_rows.iterrows(), anomaly_z, severity_codes):
             observed = row[metric_column]
-            z = row['_zscore']
             
             # Skip NaN or Inf values
             if pd.isna(observed) or pd.isna(z) or np.isinf(observed) or np.isinf(z):
@@ -211,16 +220,17 @@ class AnomalyDetectionEngine:
             if location.get('region'):
                 description = f"In {location['region']}: " + description
             
-            anomalies.append(Anomaly(
+            # Values come from validated numeric code; skip per-row Pydantic validation
+            anomalies.append(Anomaly.model_construct(
                 id=str(uuid.uuid4())[:8],
                 metric_name=metric_column,
-                observed_value=round(observed, 4),
-                expected_value=round(national_mean, 4),
-                z_score=round(z, 4),
-                deviation_percentage=round(deviation_pct, 2),
+                observed_value=round(float(observed), 4),
+                expected_value=round(float(national_mean), 4),
+                z_score=round(float(z), 4),
+                deviation_percentage=round(float(deviation_pct), 2),
                 location=location if location else None,
                 time_period=time_period,
-                severity=self._classify_severity(z),
+                severity=SEVERITY_LEVELS[severity_code],
                 description=description
             ))
         
@@ -260,13 +270,15 @@ class AnomalyDetectionEngine:
             
             predictions = iso_forest.fit_predict(scaled_features)
             anomaly_scores = iso_forest.score_samples(scaled_features)
+            severity_codes = self._severity_codes_from_score(anomaly_scores)
             
             # Find anomalies (predictions == -1)
             anomaly_indices = feature_df.index[predictions == -1]
             
             for idx in anomaly_indices:
                 row = df.loc[idx]
-                score = anomaly_scores[list(feature_df.index).index(idx)]
+                position = list(feature_df.index).index(idx)
+                score = anomaly_scores[position]
                 
                 # Build location dict
                 location = {}
@@ -296,16 +308,16 @@ class AnomalyDetectionEngine:
                 if location.get('region'):
                     description = f"In {location['region']}: " + description
                 
-                anomalies.append(Anomaly(
+                anomalies.append(Anomaly.model_construct(
                     id=str(uuid.uuid4())[:8],
                     metric_name="multivariate",
-                    observed_value=round(score, 4),
-                    expected_value=0,  # Expected score for normal points
-                    z_score=round(most_anomalous[1], 4),
-                    deviation_percentage=round((1 - score) * 100, 2),
+                    observed_value=round(float(score), 4),
+                    expected_value=0.0,  # Expected score for normal points
+                    z_score=round(float(most_anomalous[1]), 4),
+                    deviation_percentage=round(float(1 - score) * 100, 2),
                     location=location if location else None,
                     time_period=time_period,
-                    severity=self._classify_severity_from_score(score),
+                    severity=SEVERITY_LEVELS[severity_codes[position]],
                     description=description
                 ))
             
@@ -314,34 +326,21 @@ class AnomalyDetectionEngine:
         
         return anomalies
     
-    def _classify_severity(self, z_score: float) -> RiskLevel:
+    @staticmethod
+    def _severity_codes_from_z(z_scores: np.ndarray) -> np.ndarray:
         """
-        Classify severity based on Z-score magnitude.
+        Classify severity codes (indices into SEVERITY_LEVELS) from Z-scores.
         """
-        abs_z = abs(z_score)
-        
-        if abs_z > 4:
-            return RiskLevel.CRITICAL
-        elif abs_z > 3:
-            return RiskLevel.HIGH
-        elif abs_z > 2:
-            return RiskLevel.MEDIUM
-        else:
-            return RiskLevel.LOW
+        bins = np.digitize(np.abs(z_scores), ZSCORE_SEVERITY_BINS, right=True)
+        return len(ZSCORE_SEVERITY_BINS) - bins
     
-    def _classify_severity_from_score(self, anomaly_score: float) -> RiskLevel:
+    @staticmethod
+    def _severity_codes_from_score(anomaly_scores: np.ndarray) -> np.ndarray:
         """
-        Classify severity based on Isolation Forest anomaly score.
+        Classify severity codes based on Isolation Forest anomaly scores.
         Score is negative; more negative = more anomalous.
         """
-        if anomaly_score < -0.5:
-            return RiskLevel.CRITICAL
-        elif anomaly_score < -0.3:
-            return RiskLevel.HIGH
-        elif anomaly_score < -0.1:
-            return RiskLevel.MEDIUM
-        else:
-            return RiskLevel.LOW
+        return np.digitize(anomaly_scores, SCORE_SEVERITY_BINS)
     
     def _deduplicate_anomalies(
         self,
@@ -351,12 +350,6 @@ class AnomalyDetectionEngine:
         Remove duplicate anomalies, keeping highest severity.
         """
         seen = {}
-        severity_order = {
-            RiskLevel.CRITICAL: 4,
-            RiskLevel.HIGH: 3,
-            RiskLevel.MEDIUM: 2,
-            RiskLevel.LOW: 1
-        }
         
         for anomaly in anomalies:
             # Create unique key
@@ -367,7 +360,8 @@ class AnomalyDetectionEngine:
                 seen[key] = anomaly
             else:
                 existing = seen[key]
-                if severity_order[anomaly.severity] > severity_order[existing.severity]:
+                # Lower code = more severe
+                if SEVERITY_CODES[anomaly.severity] < SEVERITY_CODES[existing.severity]:
                     seen[key] = anomaly
         
         return list(seen.values())
@@ -380,16 +374,11 @@ class AnomalyDetectionEngine:
         """
         Calculate anomaly count by region.
         """
-        distribution = defaultdict(int)
-        
-        for anomaly in anomalies:
-            if anomaly.location and 'region' in anomaly.location:
-                distribution[anomaly.location['region']] += 1
-            else:
-                distribution['Unknown'] += 1
-        
-        # Sort by count descending
-        return dict(sorted(distribution.items(), key=lambda x: x[1], reverse=True))
+        regions = [
+            a.location['region'] if a.location and 'region' in a.location else 'Unknown'
+            for a in anomalies
+        ]
+        return self._count_labels(regions)
     
     def _calculate_metric_distribution(
         self,
@@ -398,12 +387,7 @@ class AnomalyDetectionEngine:
         """
         Calculate anomaly count by metric.
         """
-        distribution = defaultdict(int)
-        
-        for anomaly in anomalies:
-            distribution[anomaly.metric_name] += 1
-        
-        return dict(sorted(distribution.items(), key=lambda x: x[1], reverse=True))
+        return self._count_labels([a.metric_name for a in anomalies])
     
     def _calculate_severity_distribution(
         self,
@@ -412,17 +396,28 @@ class AnomalyDetectionEngine:
         """
         Calculate anomaly count by severity level.
         """
-        distribution = {
-            'critical': 0,
-            'high': 0,
-            'medium': 0,
-            'low': 0
-        }
+        severity_codes = np.fromiter(
+            (SEVERITY_CODES[a.severity] for a in anomalies),
+            dtype=np.int8,
+            count=len(anomalies)
+        )
+        counts = np.bincount(severity_codes, minlength=len(SEVERITY_LEVELS))
         
-        for anomaly in anomalies:
-            distribution[anomaly.severity.value] += 1
+        return {level.value: int(count) for level, count in zip(SEVERITY_LEVELS, counts)}
+    
+    @staticmethod
+    def _count_labels(labels: List[str]) -> Dict[str, int]:
+        """
+        Count occurrences of each label, sorted by count descending.
+        
+        Labels are factorized to integer codes and counted with one
+        np.bincount; ties keep first-appearance order.
+        """
+        codes, names = pd.factorize(pd.Series(labels, dtype=object))
+        counts = np.bincount(codes, minlength=len(names))
+        order = np.argsort(-counts, kind='stable')
         
-        return distribution
+        return {names[i]: int(counts[i]) for i in order}
     
     def _generate_summary(
         self,
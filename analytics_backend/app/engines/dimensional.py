@@ -152,63 +152,59 @@ class DimensionalSlicingEngine:
         aggregations = []
         outliers = []
         
-        # Group by dimension combination
-        grouped = df.groupby(dimensions, dropna=False)[metric_column].agg(['mean', 'count', 'std'])
+        # Group by dimension combination (only combinations present in the data)
+        grouped = df.groupby(dimensions, dropna=False, observed=True)[metric_column].agg(
+            ['mean', 'count', 'std']
+        )
         grouped = grouped.reset_index()
         
-        for _, row in grouped.iterrows():
-            # Skip small samples
-            if row['count'] < self.min_sample_size:
-                continue
-            
-            # Calculate z-score
-            metric_value = row['mean']
-            
-            # Skip NaN values
-            if pd.isna(metric_value):
-                continue
-                
-            z_score = (metric_value - national_mean) / national_std
-            
-            # Handle NaN or Inf z-scores
-            if pd.isna(z_score) or np.isinf(z_score):
-                z_score = 0.0
-            
+        # Skip small samples and empty groups
+        grouped = grouped[
+            (grouped['count'] >= self.min_sample_size) & grouped['mean'].notna()
+        ]
+        
+        means = grouped['mean'].to_numpy(dtype=np.float64)
+        counts = grouped['count'].to_numpy()
+        stds = grouped['std'].to_numpy(dtype=np.float64)
+        
+        # Z-scores and deviations for every group in one pass
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z_scores = (means - national_mean) / national_std
+            if national_mean != 0:
+                deviations = (means - national_mean) / national_mean * 100
+            else:
+                deviations = np.zeros_like(means)
+        z_scores[~np.isfinite(z_scores)] = 0.0
+        deviations[~np.isfinite(deviations)] = 0.0
+        
+        dimension_values = [grouped[dim].astype(str).tolist() for dim in dimensions]
+        
+        for i, (metric_value, count, std, z_score, deviation) in enumerate(
+            zip(means, counts, stds, z_scores, deviations)
+        ):
             # Build dimension dict
-            dim_dict = {dim: str(row[dim]) for dim in dimensions}
-            
-            # Calculate deviation from national
-            deviation_from_national = (
-                ((metric_value - national_mean) / national_mean) * 100 
-                if national_mean != 0 else 0.0
-            )
-            if pd.isna(deviation_from_national) or np.isinf(deviation_from_national):
-                deviation_from_national = 0.0
+            dim_dict = {dim: values[i] for dim, values in zip(dimensions, dimension_values)}
             
             # Create aggregation record
             agg_record = {
                 'dimensions': dim_dict,
                 'metric_value': round(float(metric_value), 4),
-                'sample_size': int(row['count']),
-                'std_within_group': round(float(row['std']), 4) if pd.notna(row['std']) else 0.0,
+                'sample_size': int(count),
+                'std_within_group': round(float(std), 4) if pd.notna(std) else 0.0,
                 'z_score': round(float(z_score), 4),
-                'deviation_from_national': round(float(deviation_from_national), 2)
+                'deviation_from_national': round(float(deviation), 2)
             }
             aggregations.append(agg_record)
             
             # Check if outlier
             if abs(z_score) > self.zscore_threshold:
-                deviation_pct = ((metric_value - national_mean) / national_mean * 100) if national_mean != 0 else 0.0
-                if pd.isna(deviation_pct) or np.isinf(deviation_pct):
-                    deviation_pct = 0.0
-                
                 outliers.append(OutlierCluster(
                     dimensions=dim_dict,
                     metric_value=round(metric_value, 4),
                     national_mean=round(national_mean, 4),
                     z_score=round(z_score, 4),
-                    deviation_percentage=round(deviation_pct, 2),
-                    sample_size=int(row['count']),
+                    deviation_percentage=round(deviation, 2),
+                    sample_size=int(count),
                     risk_level=self._classify_risk(z_score)
                 ))
         
@@ -415,7 +411,7 @@ class DimensionalSlicingEngine:
             return []
         
         # Aggregate by drill dimension
-        result = filtered_df.groupby(drill_dimension)[metric_column].agg([
+        result = filtered_df.groupby(drill_dimension, observed=True)[metric_column].agg([
             'mean', 'count', 'std'
         ]).reset_index()
         
@@ -2,7 +2,7 @@
 Data Preprocessor - Automated Data Ingestion & Cleaning
 
 This module handles:
-- Reading various file formats (CSV, JSON, XLSX)
+- Reading various file formats (CSV, JSON, XLSX, Parquet)
 - Automatic schema detection
 - Data cleaning and standardization
 - Missing value handling
@@ -22,6 +22,22 @@ from loguru import logger
 
 from app.models import DataQualityReport
 
+try:
+    import polars as pl
+except ImportError:  # Polars is optional; pandas remains the reference reader
+    pl = None
+
+
+# Self-describing binary formats that skip encoding detection
+BINARY_FORMATS = frozenset({'xlsx', 'xls', 'parquet'})
+
+# Tokens pandas treats as missing by default, mirrored for the Polars reader
+CSV_NULL_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None',
+    'n/a', 'nan', 'null'
+]
+
 
 class DataPreprocessor:
     """
@@ -35,6 +51,9 @@ class DataPreprocessor:
         self.original_df: Optional[pd.DataFrame] = None
         self.cleaned_df: Optional[pd.DataFrame] = None
         self.quality_report: Optional[DataQualityReport] = None
+        # Bumped whenever the loaded or cleaned data changes
+        self._data_version = 0
+        self._report_version: Optional[int] = None
         self._date_patterns = [
             r'\d{4}-\d{2}-\d{2}',  # YYYY-MM-DD
             r'\d{2}/\d{2}/\d{4}',  # DD/MM/YYYY or MM/DD/YYYY
@@ -61,15 +80,18 @@ class DataPreprocessor:
         """
         logger.info(f"Loading file: {filename}")
         
-        # Detect encoding if not provided
-        if encoding is None:
-            detected = chardet.detect(file_content)
-            encoding = detected.get('encoding', 'utf-8')
-            logger.debug(f"Detected encoding: {encoding}")
+        # New data invalidates any cached quality report
+        self._data_version += 1
         
         # Determine file type and load
         file_ext = filename.lower().split('.')[-1]
         
+        # Detect encoding if not provided (binary formats carry their own)
+        if encoding is None and file_ext not in BINARY_FORMATS:
+            detected = chardet.detect(file_content)
+            encoding = detected.get('encoding', 'utf-8')
+            logger.debug(f"Detected encoding: {encoding}")
+        
         try:
             if file_ext == 'csv':
                 self.original_df = self._load_csv(file_content, encoding)
@@ -77,6 +99,8 @@ class DataPreprocessor:
                 self.original_df = self._load_json(file_content, encoding)
             elif file_ext in ['xlsx', 'xls']:
                 self.original_df = self._load_excel(file_content)
+            elif file_ext == 'parquet':
+                self.original_df = self._load_parquet(file_content)
             else:
                 raise ValueError(f"Unsupported file format: {file_ext}")
             
@@ -88,22 +112,61 @@ class DataPreprocessor:
             raise
     
     def _load_csv(self, content: bytes, encoding: str) -> pd.DataFrame:
-        """Load CSV file with automatic delimiter detection."""
-        text = content.decode(encoding, errors='replace')
+        """
+        Load CSV file with automatic delimiter detection.
         
+        Both readers decode straight from the raw bytes, so the upload is
+        never held a second time as one large decoded string.
+        """
         # Try to detect delimiter
-        sample = text[:5000]
+        sample = content[:5000].decode(encoding, errors='replace')
         delimiters = [',', ';', '\t', '|']
         delimiter_counts = {d: sample.count(d) for d in delimiters}
         delimiter = max(delimiter_counts, key=delimiter_counts.get)
         
+        if pl is not None:
+            try:
+                return self._load_csv_polars(content, encoding, delimiter)
+            except Exception as e:
+                logger.warning(f"Polars CSV reader failed, falling back to pandas: {e}")
+        
         return pd.read_csv(
-            io.StringIO(text),
+            io.BytesIO(content),
             delimiter=delimiter,
+            encoding=encoding,
+            encoding_errors='replace',
             low_memory=False,
             on_bad_lines='skip'
         )
     
+    def _load_csv_polars(
+        self,
+        content: bytes,
+        encoding: str,
+        delimiter: str
+    ) -> pd.DataFrame:
+        """
+        Load CSV with the multithreaded Polars reader.
+        
+        The result is converted to a NumPy-backed pandas frame so the
+        cleaning pipeline and engines see the same dtypes as pd.read_csv.
+        """
+        # Polars only reads UTF-8; other charsets are transcoded first
+        if encoding and encoding.lower().replace('_', '-') in ('utf-8', 'ascii'):
+            source = content
+        else:
+            source = content.decode(encoding, errors='replace').encode('utf-8')
+        
+        pl_df = pl.read_csv(
+            io.BytesIO(source),
+            separator=delimiter,
+            infer_schema_length=None,
+            null_values=CSV_NULL_VALUES,
+            truncate_ragged_lines=True,
+            encoding='utf8-lossy'
+        )
+        return pl_df.to_pandas()
+    
     def _load_json(self, content: bytes, encoding: str) -> pd.DataFrame:
         """Load JSON file (handles both records and array format)."""
         text = content.decode(encoding, errors='replace')
@@ -118,6 +181,15 @@ class DataPreprocessor:
         """Load Excel file."""
         return pd.read_excel(io.BytesIO(content), engine='openpyxl')
     
+    def _load_parquet(self, content: bytes) -> pd.DataFrame:
+        """
+        Load Parquet file.
+        
+        Columns arrive already typed, so there is no text decoding or
+        number parsing. Arrow types map to the usual NumPy-backed dtypes.
+        """
+        return pd.read_parquet(io.BytesIO(content), engine='pyarrow')
+    
     def clean_data(self) -> pd.DataFrame:
         """
         Apply full cleaning pipeline to loaded data.
@@ -156,19 +228,20 @@ class DataPreprocessor:
         # df = self._cap_outliers(df)
         
         self.cleaned_df = df
+        self._data_version += 1
         logger.info(f"Cleaning complete. Final shape: {df.shape}")
         
         return df
     
     def _clean_column_names(self, df: pd.DataFrame) -> pd.DataFrame:
         """Standardize column names."""
-        df.columns = [
-            re.sub(r'[^\w\s]', '', str(col))  # Remove special chars
-            .strip()
-            .lower()
-            .replace(' ', '_')
-            for col in df.columns
-        ]
+        df.columns = (
+            df.columns.astype(str)
+            .str.replace(r'[^\w\s]', '', regex=True)  # Remove special chars
+            .str.strip()
+            .str.lower()
+            .str.replace(' ', '_', regex=False)
+        )
         return df
     
     def _standardize_data_types(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -311,6 +384,10 @@ class DataPreprocessor:
         
         df = self.original_df
         
+        # Reuse the cached report until load_file() or clean_data() runs again
+        if self._report_version == self._data_version and self.quality_report is not None:
+            return self.quality_report
+        
         # Calculate missing values
         missing_values = df.isna().sum().to_dict()
         missing_values = {k: int(v) for k, v in missing_values.items() if v > 0}
@@ -357,6 +434,7 @@ class DataPreprocessor:
             quality_score=quality_score,
             issues=issues
         )
+        self._report_version = self._data_version
         
         return self.quality_report
     
@@ -374,18 +452,30 @@ class DataPreprocessor:
         if df is None:
             return {}
         
+        numeric_cols = df.select_dtypes(include=['number']).columns
+        categorical_cols = df.select_dtypes(include=['object', 'category']).columns
+        
+        # Deep introspection only matters for Python object columns; Arrow-backed
+        # and numeric columns report exact byte sizes without walking values
+        needs_deep_scan = any(dtype == object for dtype in df.dtypes)
+        
         stats = {
             'shape': {'rows': len(df), 'columns': len(df.columns)},
-            'memory_usage_mb': df.memory_usage(deep=True).sum() / 1024 / 1024,
-            'numeric_summary': df.describe().to_dict() if len(df.select_dtypes(include=['number']).columns) > 0 else {},
+            'memory_usage_mb': df.memory_usage(deep=needs_deep_scan).sum() / 1024 / 1024,
+            'numeric_summary': df[numeric_cols].describe().to_dict() if len(numeric_cols) > 0 else {},
             'categorical_summary': {}
         }
         
-        # Add categorical summaries
-        for col in df.select_dtypes(include=['object', 'category']).columns:
-            value_counts = df[col].value_counts().head(10).to_dict()
+        if len(categorical_cols) == 0:
+            return stats
+        
+        # Add categorical summaries (unique counts computed in a single pass)
+        unique_counts = df[categorical_cols].nunique()
+        for col in categorical_cols:
+            # Partial selection of the top 10 instead of sorting every unique value
+            value_counts = df[col].value_counts(sort=False).nlargest(10).to_dict()
             stats['categorical_summary'][col] = {
-                'unique_values': df[col].nunique(),
+                'unique_values': int(unique_counts[col]),
                 'top_values': value_counts
             }
         
@@ -7,6 +7,7 @@ CORS setup, and route registration.
 
 import os
 from contextlib import asynccontextmanager
+from typing import Optional
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
@@ -14,15 +15,42 @@ from loguru import logger
 
 from app.config import settings
 from app.api.routes import router
+from app.api.responses import ORJSONResponse
+from app.services.llm_reasoning import close_llm_http_client
+from app.services.orchestrator import init_engine_slots
+from app.services.rate_limiter import init_llm_concurrency_limiter, init_llm_rate_limiter
+
+
+# Loguru id of the rotating file sink, once registered
+_file_sink_id: Optional[int] = None
+
+
+def configure_file_logging() -> None:
+    """
+    Register the rotating log file sink.
+    
+    Safe to call more than once: the id returned by logger.add() is kept,
+    and later calls return without adding a second sink for the same file.
+    """
+    global _file_sink_id
+    if _file_sink_id is not None:
+        return
+    
+    # Create logs directory before the first write
+    log_dir = os.path.dirname(settings.log_file)
+    if log_dir:
+        os.makedirs(log_dir, exist_ok=True)
+    
+    _file_sink_id = logger.add(
+        settings.log_file,
+        rotation="10 MB",
+        retention="7 days",
+        level=settings.log_level
+    )
 
 
 # Configure logging
-logger.add(
-    settings.log_file,
-    rotation="10 MB",
-    retention="7 days",
-    level=settings.log_level
-)
+configure_file_logging()
 
 
 @asynccontextmanager
@@ -32,14 +60,15 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Aadhaar Pulse Analytics Backend")
     logger.info(f"Environment: {settings.environment}")
     logger.info(f"LLM Provider: {settings.llm_provider}")
-    
-    # Create logs directory if needed
-    os.makedirs(os.path.dirname(settings.log_file), exist_ok=True)
+    init_engine_slots()
+    init_llm_concurrency_limiter()
+    init_llm_rate_limiter()
     
     yield
     
     # Shutdown
     logger.info("Shutting down Aadhaar Pulse Analytics Backend")
+    await close_llm_http_client()
 
 
 # Create FastAPI application
@@ -68,6 +97,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -82,8 +112,12 @@ app.add_middleware(
     max_age=3600,  # Cache preflight requests for 1 hour
 )
 
-# Add Gzip compression
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Add Gzip compression (level 5 keeps analytics JSON small at a fraction of level 9's CPU)
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=settings.gzip_minimum_size,
+    compresslevel=settings.gzip_compression_level
+)
 
 # Include API routes
 app.include_router(router, prefix="/api", tags=["Analysis"])
@@ -4,10 +4,11 @@ Pydantic Models for Aadhaar Pulse Analytics Backend
 Defines request/response schemas for API endpoints.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
-from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Literal, Optional, Union
+from pydantic import BaseModel, Field, PrivateAttr
+from pydantic_core import PydanticSerializationError
 
 
 # ============================================================================
@@ -49,9 +50,30 @@ class VisualizationType(str, Enum):
 # Base Models
 # ============================================================================
 
+def utc_now() -> datetime:
+    """Timezone-aware current UTC time (datetime.utcnow is deprecated)."""
+    return datetime.now(timezone.utc)
+
+
+def _compact_json(model: BaseModel, **kwargs) -> bytes:
+    """
+    Dump a model to compact JSON bytes, keeping None-valued fields as null.
+    
+    Engine visualization dicts may hold NumPy scalars that Pydantic's
+    JSON serializer rejects; those models are encoded with the backend's
+    shared json_dumps.
+    """
+    try:
+        return model.model_dump_json(by_alias=True, **kwargs).encode()
+    except PydanticSerializationError:
+        # Imported here: app.services imports this module at package load
+        from app.services.json_io import json_dumps
+        return json_dumps(model.model_dump(by_alias=True, **kwargs))
+
+
 class TimestampMixin(BaseModel):
     """Mixin for timestamp fields."""
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now)
     updated_at: Optional[datetime] = None
 
 
@@ -193,9 +215,13 @@ class AnomalyDetectionOutput(BaseModel):
 # LLM Reasoning Models
 # ============================================================================
 
+FactorType = Literal["policy", "weather", "infrastructure", "demographic", "other"]
+ComplexityLevel = Literal["low", "medium", "high"]
+
+
 class ContextualFactor(BaseModel):
     """External contextual factor identified by LLM."""
-    factor_type: str  # "policy", "weather", "infrastructure", "demographic"
+    factor_type: FactorType
     description: str
     relevance_score: float = Field(ge=0, le=1)
     source: Optional[str] = None
@@ -208,7 +234,7 @@ class StrategicRecommendation(BaseModel):
     recommendation: str
     rationale: str
     expected_impact: str
-    implementation_complexity: str  # "low", "medium", "high"
+    implementation_complexity: ComplexityLevel
     affected_regions: List[str]
     timeline: str
 
@@ -235,6 +261,20 @@ class VisualizationSpec(BaseModel):
     description: str
     data: Dict[str, Any]
     config: Dict[str, Any] = {}
+    
+    _json: Optional[bytes] = PrivateAttr(default=None)
+    
+    def to_json(self) -> bytes:
+        """
+        Serialize for API responses, memoized per spec.
+        
+        Chart payloads are the bulk of a result and specs are not modified
+        once the package is assembled, so repeated polls of the same job
+        reuse the encoded bytes.
+        """
+        if self._json is None:
+            self._json = _compact_json(self)
+        return self._json
 
 
 class StatisticalAbstract(BaseModel):
@@ -245,14 +285,24 @@ class StatisticalAbstract(BaseModel):
     anomaly_findings: AnomalyDetectionOutput
 
 
+class DataSummary(BaseModel):
+    """Shape of the analyzed dataset and the columns used."""
+    total_records: int
+    total_columns: int
+    numeric_columns: List[str]
+    target_column: Optional[str] = None
+    region_column: Optional[str] = None
+    time_column: Optional[str] = None
+
+
 class AnalysisPackage(BaseModel):
     """Complete analysis package sent to frontend."""
     job_id: str
     status: AnalysisStatus
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utc_now)
     
     # Data Summary
-    data_summary: Dict[str, Any]
+    data_summary: DataSummary
     
     # Statistical Abstract
     statistical_abstract: StatisticalAbstract
@@ -266,6 +316,21 @@ class AnalysisPackage(BaseModel):
     # Metadata
     processing_time_seconds: float
     data_quality_score: float
+    
+    def to_json(self) -> bytes:
+        """
+        Serialize for API responses as compact JSON bytes.
+        
+        Visualizations are spliced in from their memoized spec bytes, so
+        repeated polls of a job only re-encode the other sections.
+        """
+        sections = [
+            b'"visualizations":[' + b','.join(spec.to_json() for spec in self.visualizations) + b']'
+            if name == 'visualizations'
+            else _compact_json(self, include={name})[1:-1]
+            for name in type(self).model_fields
+        ]
+        return b'{' + b','.join(sections) + b'}'
 
 
 # ============================================================================
@@ -294,12 +359,19 @@ class AnalysisStatusResponse(BaseModel):
     errors: List[str] = []
 
 
+class ComponentHealth(BaseModel):
+    """Status of each backend component."""
+    api: str
+    analytics: str
+    llm: str
+
+
 class HealthCheckResponse(BaseModel):
     """Health check response."""
     status: str
     timestamp: datetime
     version: str
-    components: Dict[str, str]
+    components: ComponentHealth
 
 
 # Forward reference resolution
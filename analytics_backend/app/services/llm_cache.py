@@ -0,0 +1,170 @@
+"""
+LLM Response Cache - Content-Addressed Storage for Reasoning Calls
+
+LLM reasoning is the slowest and most expensive stage of an analysis.
+Identical statistical abstracts (re-runs, retries, iteration on the same
+upload) produce identical prompts, so raw responses are stored in a local
+SQLite table keyed by a SHA-256 of the prompt and generation parameters,
+fronted by a small in-process LRU so repeated hits skip the database.
+
+Cache modes:
+- enabled: read hits, write misses
+- read_only: read hits, never write
+- write_only: always call the LLM, record responses
+- replay: read hits, raise LLMCacheMiss on a miss (reproducible runs)
+- disabled: bypass the cache entirely
+
+With number quantization enabled, decimals in the prompt are rounded to a
+few significant digits before hashing, so re-runs whose statistics differ
+only in insignificant digits (CV=1.234 vs CV=1.235) share an entry.
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import Optional
+
+from cachetools import LRUCache, TTLCache
+from loguru import logger
+
+_DECIMAL_RE = re.compile(r"-?\d+\.\d+")
+
+
+class LLMCacheMiss(LookupError):
+    """Raised in replay mode when a prompt has no cached response."""
+
+
+class LLMResponseCache:
+    """
+    SQLite-backed cache of raw LLM responses.
+    
+    A short-lived connection is opened per operation and the in-process
+    LRU is guarded by a lock, so the cache is safe to share between
+    requests and worker threads. Hit and miss counts are kept for
+    monitoring.
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        mode: str = "enabled",
+        ttl_seconds: int = 0,
+        memory_size: int = 128
+    ):
+        self.path = path
+        self.mode = mode
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._memory = (
+            TTLCache(maxsize=memory_size, ttl=ttl_seconds) if ttl_seconds
+            else LRUCache(maxsize=memory_size)
+        )
+        self._memory_lock = threading.Lock()
+        
+        if self.mode != "disabled":
+            self._ensure_table()
+    
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        number_digits: int = 0
+    ) -> str:
+        """
+        SHA-256 over the prompt and every parameter that shapes the response.
+        
+        Args:
+            number_digits: If > 0, round decimals in the prompt to this many
+                significant digits before hashing
+        """
+        if number_digits > 0:
+            prompt = _DECIMAL_RE.sub(
+                lambda m: f"{float(m.group()):.{number_digits}g}", prompt
+            )
+        digest = hashlib.sha256()
+        for part in (provider, model, str(temperature), str(max_tokens), prompt):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Return the cached response for key, or None on a miss.
+        
+        Raises:
+            LLMCacheMiss: In replay mode when no fresh entry exists
+        """
+        if self.mode not in ("enabled", "read_only", "replay"):
+            return None
+        
+        with self._memory_lock:
+            response = self._memory.get(key)
+            if response is not None:
+                self.hits += 1
+                return response
+        
+        try:
+            with closing(self._connect()) as conn, conn:
+                row = conn.execute(
+                    "SELECT response, created_at FROM llm_responses WHERE key = ?",
+                    (key,)
+                ).fetchone()
+            if row and (not self.ttl_seconds or time.time() - row[1] < self.ttl_seconds):
+                response = row[0]
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache read failed: {e}")
+        
+        with self._memory_lock:
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._memory[key] = response
+        
+        if response is None and self.mode == "replay":
+            raise LLMCacheMiss(f"No cached LLM response for key {key[:12]}")
+        return response
+    
+    def put(self, key: str, response: str) -> None:
+        """Store a response if the current mode records new entries."""
+        if self.mode not in ("enabled", "write_only"):
+            return
+        
+        if self.mode == "enabled":
+            with self._memory_lock:
+                self._memory[key] = response
+        
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_responses (key, response, created_at) "
+                    "VALUES (?, ?, ?)",
+                    (key, response, time.time())
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache write failed: {e}")
+    
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5.0)
+    
+    def _ensure_table(self) -> None:
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_responses ("
+                    "key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL)"
+                )
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"LLM cache unavailable, continuing without it: {e}")
+            self.mode = "disabled"
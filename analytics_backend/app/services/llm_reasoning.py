@@ -13,11 +13,13 @@ like "Bihar shows erratic enrollment patterns likely due to monsoon disruptions.
 
 import asyncio
 import json
-import re
-from typing import Any, Dict, List, Optional
+import math
+from typing import Any, Callable, Dict, List, Optional, get_args
 from datetime import datetime
 import httpx
+import numpy as np
 from loguru import logger
+from pydantic import TypeAdapter
 
 from app.models import (
     StatisticalAbstract,
@@ -27,9 +29,230 @@ from app.models import (
     CorrelationEngineOutput,
     VolatilityScoringOutput,
     DimensionalSlicingOutput,
-    AnomalyDetectionOutput
+    AnomalyDetectionOutput,
+    ComplexityLevel,
+    FactorType,
+    RiskLevel
 )
 from app.config import settings
+from app.services.json_io import json_dumps, json_loads
+from app.services.llm_cache import LLMResponseCache
+from app.services.resilience import (
+    CircuitOpenError,
+    get_llm_circuit_breaker,
+    post_with_retry
+)
+from app.services.rate_limiter import (
+    estimate_tokens,
+    get_llm_concurrency_limiter,
+    get_llm_rate_limiter
+)
+
+try:
+    import h2  # noqa: F401  (enables httpx HTTP/2 support)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Generation parameters shared by every provider call (and the cache key)
+LLM_TEMPERATURE = 0.7
+LLM_MAX_TOKENS = 4000
+
+# Fixed instructions sent as the system turn. Providers cache a stable
+# prompt prefix, so nothing per-analysis may appear in this text; the
+# statistics travel in the user turn built by _build_analysis_prompt.
+_SYSTEM_PROMPT = """You are a senior data scientist and domain expert at UIDAI (Unique Identification Authority of India), 
+specializing in analyzing Aadhaar enrollment, update, and authentication data across India's 28 states and 8 union territories.
+
+## Your Expertise:
+- Deep understanding of Aadhaar ecosystem: enrollments, updates, authentication, e-KYC
+- Knowledge of regional variations across Indian states (population density, literacy rates, digital infrastructure)
+- Awareness of seasonal patterns: monsoons (June-Sept), festival seasons, school admission periods (April-June)
+- Understanding of demographic segments: children (0-5, 5-17), adults (18+), senior citizens
+- Familiarity with enrollment infrastructure: permanent centers, mobile vans, CSCs (Common Service Centers)
+
+The statistical analysis results to interpret are given in the user message.
+
+## Understanding Volatility Metrics:
+**Coefficient of Variation (CV) = Standard Deviation / Mean**
+- CV < 0.15 (15%) = **STABLE** - Normal, consistent performance
+- CV 0.15-0.5 (15%-50%) = **MODERATE** - Some variability, acceptable
+- CV 0.5-1.0 (50%-100%) = **HIGH** - Significant fluctuation, needs attention
+- CV > 1.0 (100%+) = **ERRATIC** - Extreme volatility, critical issue
+
+IMPORTANT: Do NOT describe regions with CV < 0.15 as "volatile" or "significant volatility". 
+These are STABLE regions with normal variation. Only regions with CV > 0.5 require attention.
+
+## Analysis Guidelines:
+When analyzing, consider these India-specific factors:
+- **Regional Variations**: States like Bihar, UP, Jharkhand may show different patterns than Kerala, Tamil Nadu
+- **Urban vs Rural**: Metro cities vs tier-2/3 cities vs villages have vastly different infrastructure
+- **Seasonal Impact**: Monsoons disrupt operations in flood-prone areas; festivals affect footfall
+- **Infrastructure Gaps**: Power outages, internet connectivity issues in remote areas
+- **Demographic Trends**: Child enrollments peak during school admissions; senior citizen updates during pension verification
+
+## Your Task:
+Provide a comprehensive analysis in the following structure:
+
+1. **Executive Summary** (2-3 impactful sentences): 
+   - Lead with the most critical finding
+   - Quantify the impact where possible
+   - Highlight any urgent action needed
+
+2. **Root Cause Analysis** (3-5 causes):
+   For each pattern/anomaly, identify likely root causes considering:
+   - Demographic factors (age distribution, urban/rural split)
+   - Infrastructure issues (equipment failure, connectivity, power)
+   - Seasonal factors (monsoon disruption, festival closures, exam seasons)
+   - Policy/administrative changes (new guidelines, staff training needs)
+   - Regional socioeconomic conditions (migration, literacy, awareness)
+
+3. **Contextual Factors** (2-4 factors):
+   External factors influencing the data:
+   - Government schemes (DBT linkages, PMJAY, ration card linking)
+   - Weather events (floods, cyclones, extreme heat)
+   - Infrastructure changes (new centers, equipment upgrades)
+   - Demographic shifts (migration patterns, population growth)
+
+4. **Strategic Recommendations** (3-5 actionable items):
+   Each recommendation must include:
+   - Priority: 1 (critical/immediate) to 5 (nice-to-have)
+   - Specific action with clear ownership
+   - Data-driven rationale
+   - Measurable expected impact
+   - Implementation complexity: low/medium/high
+   - Affected regions (specific states/districts if applicable)
+   - Realistic timeline
+
+5. **Risk Assessment**:
+   What happens if these issues are not addressed? Consider:
+   - Service delivery impact
+   - Citizen inconvenience
+   - Compliance/audit risks
+   - Reputation risks
+
+6. **Confidence Score** (0.0-1.0):
+   Based on data quality and pattern clarity
+
+## Response Format (strict JSON):
+{
+    "executive_summary": "Clear, impactful summary with key metrics...",
+    "root_causes": [
+        "Specific cause 1 with context...",
+        "Specific cause 2 with context..."
+    ],
+    "contextual_factors": [
+        {"factor_type": "policy|weather|infrastructure|demographic", "description": "Detailed description...", "relevance_score": 0.0-1.0}
+    ],
+    "recommendations": [
+        {
+            "priority": 1,
+            "recommendation": "Specific action...",
+            "rationale": "Data-driven reasoning...",
+            "expected_impact": "Quantified improvement...",
+            "implementation_complexity": "low|medium|high",
+            "affected_regions": ["State1", "State2"],
+            "timeline": "Realistic timeframe..."
+        }
+    ],
+    "risk_assessment": "Comprehensive risk analysis...",
+    "confidence_score": 0.85
+}
+
+IMPORTANT: Respond ONLY with valid JSON. No markdown, no explanations outside JSON."""
+
+_SYSTEM_PROMPT_TOKENS = estimate_tokens(_SYSTEM_PROMPT)
+
+# Llama chat framing for the Hugging Face text-generation fallback
+_LLAMA_PROMPT_HEADER = (
+    "<|begin_of_text|><|start_header_id|>system<|end_header_id|>\n"
+    + _SYSTEM_PROMPT
+    + "<|eot_id|><|start_header_id|>user<|end_header_id|>\n"
+)
+_LLAMA_PROMPT_FOOTER = "<|eot_id|><|start_header_id|>assistant<|end_header_id|>\n"
+
+# Validators for parsed LLM output, built once at import instead of per item
+_CONTEXTUAL_FACTORS_ADAPTER = TypeAdapter(List[ContextualFactor])
+_RECOMMENDATIONS_ADAPTER = TypeAdapter(List[StrategicRecommendation])
+
+_FACTOR_TYPES = frozenset(get_args(FactorType))
+_COMPLEXITY_LEVELS = frozenset(get_args(ComplexityLevel))
+
+# Severities/risk levels that the rule-based and fallback reports escalate
+_HIGH_RISK_LEVELS = frozenset({RiskLevel.CRITICAL, RiskLevel.HIGH})
+
+
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def get_llm_http_client() -> httpx.AsyncClient:
+    """
+    Process-wide pooled HTTP client shared by every LLMReasoningLayer.
+    
+    Each analysis job gets its own reasoning layer, so a per-instance
+    client paid a fresh TCP+TLS handshake per job. The shared pool keeps
+    provider connections alive between jobs and, when h2 is installed,
+    multiplexes concurrent calls over HTTP/2.
+    """
+    global _shared_client
+    # Lifecycle is owned by the app: close_llm_http_client() resets this to None
+    if _shared_client is None:
+        _shared_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=settings.llm_http_max_keepalive_connections,
+                max_connections=settings.llm_http_max_connections,
+                keepalive_expiry=settings.llm_http_keepalive_expiry_seconds
+            )
+        )
+    return _shared_client
+
+
+async def close_llm_http_client() -> None:
+    """Close the shared HTTP client (application shutdown)."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+    _shared_client = None
+
+
+def _closed_choice(value: Any, choices: frozenset, default: str) -> str:
+    """Map a free-form LLM label onto a closed set, falling back to default."""
+    label = str(value).strip().lower() if value is not None else default
+    return label if label in choices else default
+
+
+# Hugging Face models that rejected chat completions (client error, not
+# throttling/outage); they go straight to text generation afterwards
+_HF_TEXT_ONLY_MODELS: set = set()
+_HF_CHAT_UNSUPPORTED_STATUS = frozenset({400, 404, 422})
+
+# Noise source for differential privacy (PCG64 is faster than the legacy global RNG)
+_DP_RNG = np.random.default_rng()
+
+# Handles replies with trailing text after the JSON object
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _extract_json_object(text: str) -> Any:
+    """
+    Decode the JSON object embedded in an LLM reply.
+    
+    Models often wrap the object in prose or code fences. The span from
+    the first '{' to the last '}' is tried first (two linear scans, no
+    regex backtracking); if the trailing text contains braces too, the
+    object is decoded from its opening brace and the rest is ignored.
+    """
+    start = text.find('{')
+    end = text.rfind('}')
+    if start == -1 or end < start:
+        raise ValueError("No JSON found in response")
+    
+    try:
+        return json_loads(text[start:end + 1])
+    except ValueError:  # orjson.JSONDecodeError is a ValueError
+        return _JSON_DECODER.raw_decode(text, start)[0]
 
 
 class LLMReasoningLayer:
@@ -59,23 +282,32 @@ class LLMReasoningLayer:
         else:
             self.api_key = api_key or settings.anthropic_api_key
             self.model = model or settings.anthropic_model
+        
+        # Provider call bound once; None for an unknown provider
+        self._provider_call = {
+            "openai": self._call_openai,
+            "anthropic": self._call_anthropic,
+            "huggingface": self._call_huggingface
+        }.get(self.provider)
             
         self.enable_web_search = enable_web_search
         self.epsilon = settings.differential_privacy_epsilon
+        self.dp_mechanism = settings.differential_privacy_mechanism
+        self.dp_delta = settings.differential_privacy_delta
         
-        # HTTP client for API calls
-        self._client: Optional[httpx.AsyncClient] = None
+        # Responses keyed by prompt and generation parameters
+        self._cache = LLMResponseCache(
+            settings.llm_cache_path,
+            mode=settings.llm_cache_mode,
+            ttl_seconds=settings.llm_cache_ttl_seconds
+        )
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create async HTTP client."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(timeout=60.0)
-        return self._client
+        """Get the shared async HTTP client."""
+        return get_llm_http_client()
     
     async def close(self):
-        """Close HTTP client."""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
+        """Release per-instance resources (the shared HTTP client stays open)."""
     
     async def analyze(
         self,
@@ -85,6 +317,11 @@ class LLMReasoningLayer:
         """
         Generate intelligence report from statistical findings.
         
+        The executive summary, root causes, contextual factors,
+        recommendations, risk assessment and confidence score are all
+        requested in a single prompt and parsed from one JSON reply, so
+        the shared instructions are only sent once per analysis.
+        
         Args:
             statistical_abstract: Output from all analytical engines
             additional_context: Optional additional context information
@@ -103,7 +340,11 @@ class LLMReasoningLayer:
         # Get LLM response
         try:
             if self.api_key:
-                llm_response = await self._call_llm(prompt)
+                try:
+                    llm_response = await self._call_llm_cached(prompt)
+                except CircuitOpenError:
+                    logger.warning("LLM provider unavailable (circuit open), using rule-based analysis")
+                    llm_response = self._rule_based_analysis(statistical_abstract)
             else:
                 # Fallback to rule-based analysis if no API key
                 logger.warning("No LLM API key configured, using rule-based analysis")
@@ -122,6 +363,55 @@ class LLMReasoningLayer:
             logger.error(f"LLM analysis failed: {e}")
             return self._fallback_output(statistical_abstract, str(e))
     
+    async def analyze_many(
+        self,
+        abstracts: List[StatisticalAbstract],
+        contexts: Optional[List[Optional[Dict[str, Any]]]] = None,
+        max_concurrency: Optional[int] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> List[LLMReasoningOutput]:
+        """
+        Generate intelligence reports for several abstracts concurrently.
+        
+        Provider calls still pass through the shared concurrency cap and
+        token bucket (LLM_MAX_CONCURRENT_REQUESTS, LLM_REQUESTS_PER_MINUTE,
+        LLM_TOKENS_PER_MINUTE), so the fan-out stays within the provider
+        tier's limits.
+        
+        Args:
+            abstracts: Statistical abstracts to analyze (e.g. one per state)
+            contexts: Optional additional context per abstract
+            max_concurrency: Optional cap on analyses in progress at once
+            on_progress: Optional callback(completed, total) after each report
+            
+        Returns:
+            One LLMReasoningOutput per abstract, in input order
+        """
+        contexts = contexts or [None] * len(abstracts)
+        limit = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        completed = 0
+        
+        async def run_one(abstract, context):
+            nonlocal completed
+            try:
+                if limit is None:
+                    return await self.analyze(abstract, context)
+                async with limit:
+                    return await self.analyze(abstract, context)
+            finally:
+                completed += 1
+                if on_progress:
+                    on_progress(completed, len(abstracts))
+        
+        results = await asyncio.gather(
+            *(run_one(a, c) for a, c in zip(abstracts, contexts)),
+            return_exceptions=True
+        )
+        return [
+            self._fallback_output(abstract, str(result)) if isinstance(result, Exception) else result
+            for abstract, result in zip(abstracts, results)
+        ]
+    
     def _prepare_statistical_summary(
         self,
         abstract: StatisticalAbstract
@@ -129,23 +419,27 @@ class LLMReasoningLayer:
         """
         Prepare a structured text summary of statistical findings for LLM.
         """
-        sections = []
+        sections: List[str] = []
         
         # Correlation findings
         corr = abstract.correlation_findings
         if corr.strong_correlations:
-            sections.append("## Correlation Analysis Findings")
-            sections.append(f"Found {len(corr.strong_correlations)} strong correlations.")
-            sections.append("Top correlations:")
-            for c in corr.strong_correlations[:5]:
-                sections.append(
-                    f"- {c.variable_1} ↔ {c.variable_2}: r={c.correlation_coefficient:.3f} "
-                    f"(p={c.p_value:.4f}, {c.relationship_type})"
-                )
+            sections.extend((
+                "## Correlation Analysis Findings",
+                f"Found {len(corr.strong_correlations)} strong correlations.",
+                "Top correlations:"
+            ))
+            sections.extend(
+                f"- {c.variable_1} ↔ {c.variable_2}: r={c.correlation_coefficient:.3f} "
+                f"(p={c.p_value:.4f}, {c.relationship_type})"
+                for c in corr.strong_correlations[:5]
+            )
             if corr.driver_variables:
                 sections.append("Key driver variables:")
-                for d in corr.driver_variables[:3]:
-                    sections.append(f"- {d['variable']}: driver score={d['driver_score']:.3f}")
+                sections.extend(
+                    f"- {d['variable']}: driver score={d['driver_score']:.3f}"
+                    for d in corr.driver_variables[:3]
+                )
         
         # Volatility findings
         vol = abstract.volatility_findings
@@ -168,26 +462,28 @@ class LLMReasoningLayer:
         # Dimensional slicing findings
         dim = abstract.dimensional_findings
         if dim.outlier_clusters:
-            sections.append("\n## Dimensional Analysis Findings")
-            sections.append(f"Found {len(dim.outlier_clusters)} outlier clusters.")
-            sections.append("Top anomalous combinations:")
-            for o in dim.top_anomalies[:5]:
-                dims = " × ".join([f"{k}={v}" for k, v in o.dimensions.items()])
-                sections.append(
-                    f"- {dims}: value={o.metric_value:.2f}, "
-                    f"z-score={o.z_score:.2f}, {o.risk_level.value} risk"
-                )
+            sections.extend((
+                "\n## Dimensional Analysis Findings",
+                f"Found {len(dim.outlier_clusters)} outlier clusters.",
+                "Top anomalous combinations:"
+            ))
+            sections.extend(
+                f"- {' × '.join(f'{k}={v}' for k, v in o.dimensions.items())}: "
+                f"value={o.metric_value:.2f}, z-score={o.z_score:.2f}, {o.risk_level.value} risk"
+                for o in dim.top_anomalies[:5]
+            )
         
         # Anomaly detection findings
         anom = abstract.anomaly_findings
         if anom.anomalies:
-            sections.append("\n## Anomaly Detection Findings")
-            sections.append(f"Total anomalies: {anom.total_anomalies}")
-            sections.append(f"Severity: Critical={anom.severity_distribution.get('critical', 0)}, "
-                          f"High={anom.severity_distribution.get('high', 0)}")
-            sections.append("Top anomalies:")
-            for a in anom.anomalies[:5]:
-                sections.append(f"- {a.description}")
+            severity = anom.severity_distribution
+            sections.extend((
+                "\n## Anomaly Detection Findings",
+                f"Total anomalies: {anom.total_anomalies}",
+                f"Severity: Critical={severity.get('critical', 0)}, High={severity.get('high', 0)}",
+                "Top anomalies:"
+            ))
+            sections.extend(f"- {a.description}" for a in anom.anomalies[:5])
         
         return "\n".join(sections)
     
@@ -197,156 +493,130 @@ class LLMReasoningLayer:
         additional_context: Optional[Dict[str, Any]]
     ) -> str:
         """
-        Build the prompt for LLM analysis.
+        Build the user turn for LLM analysis.
+        
+        Only the per-analysis statistics and context go here; the fixed
+        instructions are sent separately as _SYSTEM_PROMPT.
         """
         context_info = ""
         if additional_context:
-            context_info = f"\n\nAdditional Context:\n{json.dumps(additional_context, indent=2)}"
+            context_info = f"\n\nAdditional Context:\n{json_dumps(additional_context, indent=True).decode()}"
         
-        prompt = f"""You are a senior data scientist and domain expert at UIDAI (Unique Identification Authority of India), 
-specializing in analyzing Aadhaar enrollment, update, and authentication data across India's 28 states and 8 union territories.
-
-## Your Expertise:
-- Deep understanding of Aadhaar ecosystem: enrollments, updates, authentication, e-KYC
-- Knowledge of regional variations across Indian states (population density, literacy rates, digital infrastructure)
-- Awareness of seasonal patterns: monsoons (June-Sept), festival seasons, school admission periods (April-June)
-- Understanding of demographic segments: children (0-5, 5-17), adults (18+), senior citizens
-- Familiarity with enrollment infrastructure: permanent centers, mobile vans, CSCs (Common Service Centers)
-
-## Statistical Analysis Results:
-{statistical_summary}
-{context_info}
-
-## Understanding Volatility Metrics:
-**Coefficient of Variation (CV) = Standard Deviation / Mean**
-- CV < 0.15 (15%) = **STABLE** - Normal, consistent performance
-- CV 0.15-0.5 (15%-50%) = **MODERATE** - Some variability, acceptable
-- CV 0.5-1.0 (50%-100%) = **HIGH** - Significant fluctuation, needs attention
-- CV > 1.0 (100%+) = **ERRATIC** - Extreme volatility, critical issue
-
-IMPORTANT: Do NOT describe regions with CV < 0.15 as "volatile" or "significant volatility". 
-These are STABLE regions with normal variation. Only regions with CV > 0.5 require attention.
-
-## Analysis Guidelines:
-When analyzing, consider these India-specific factors:
-- **Regional Variations**: States like Bihar, UP, Jharkhand may show different patterns than Kerala, Tamil Nadu
-- **Urban vs Rural**: Metro cities vs tier-2/3 cities vs villages have vastly different infrastructure
-- **Seasonal Impact**: Monsoons disrupt operations in flood-prone areas; festivals affect footfall
-- **Infrastructure Gaps**: Power outages, internet connectivity issues in remote areas
-- **Demographic Trends**: Child enrollments peak during school admissions; senior citizen updates during pension verification
-
-## Your Task:
-Provide a comprehensive analysis in the following structure:
-
-1. **Executive Summary** (2-3 impactful sentences): 
-   - Lead with the most critical finding
-   - Quantify the impact where possible
-   - Highlight any urgent action needed
-
-2. **Root Cause Analysis** (3-5 causes):
-   For each pattern/anomaly, identify likely root causes considering:
-   - Demographic factors (age distribution, urban/rural split)
-   - Infrastructure issues (equipment failure, connectivity, power)
-   - Seasonal factors (monsoon disruption, festival closures, exam seasons)
-   - Policy/administrative changes (new guidelines, staff training needs)
-   - Regional socioeconomic conditions (migration, literacy, awareness)
-
-3. **Contextual Factors** (2-4 factors):
-   External factors influencing the data:
-   - Government schemes (DBT linkages, PMJAY, ration card linking)
-   - Weather events (floods, cyclones, extreme heat)
-   - Infrastructure changes (new centers, equipment upgrades)
-   - Demographic shifts (migration patterns, population growth)
-
-4. **Strategic Recommendations** (3-5 actionable items):
-   Each recommendation must include:
-   - Priority: 1 (critical/immediate) to 5 (nice-to-have)
-   - Specific action with clear ownership
-   - Data-driven rationale
-   - Measurable expected impact
-   - Implementation complexity: low/medium/high
-   - Affected regions (specific states/districts if applicable)
-   - Realistic timeline
-
-5. **Risk Assessment**:
-   What happens if these issues are not addressed? Consider:
-   - Service delivery impact
-   - Citizen inconvenience
-   - Compliance/audit risks
-   - Reputation risks
-
-6. **Confidence Score** (0.0-1.0):
-   Based on data quality and pattern clarity
-
-## Response Format (strict JSON):
-{{
-    "executive_summary": "Clear, impactful summary with key metrics...",
-    "root_causes": [
-        "Specific cause 1 with context...",
-        "Specific cause 2 with context..."
-    ],
-    "contextual_factors": [
-        {{"factor_type": "policy|weather|infrastructure|demographic", "description": "Detailed description...", "relevance_score": 0.0-1.0}}
-    ],
-    "recommendations": [
-        {{
-            "priority": 1,
-            "recommendation": "Specific action...",
-            "rationale": "Data-driven reasoning...",
-            "expected_impact": "Quantified improvement...",
-            "implementation_complexity": "low|medium|high",
-            "affected_regions": ["State1", "State2"],
-            "timeline": "Realistic timeframe..."
-        }}
-    ],
-    "risk_assessment": "Comprehensive risk analysis...",
-    "confidence_score": 0.85
-}}
-
-IMPORTANT: Respond ONLY with valid JSON. No markdown, no explanations outside JSON."""
+        return "## Statistical Analysis Results:\n" + statistical_summary + "\n" + context_info
+    
+    async def _call_llm_cached(self, prompt: str) -> str:
+        """
+        Call the LLM, reusing a stored response for an identical prompt.
+        
+        Cache lookups and writes hit SQLite, which can block for up to its
+        busy timeout, so they run in a worker thread off the event loop.
+        """
+        key = LLMResponseCache.make_key(
+            self.provider, self.model, _SYSTEM_PROMPT + prompt, LLM_TEMPERATURE, LLM_MAX_TOKENS,
+            number_digits=settings.llm_cache_number_digits
+        )
+        cached = await asyncio.to_thread(self._cache.get, key)
+        if cached is not None:
+            logger.info("Using cached LLM response")
+            return cached
         
-        return prompt
+        response = await self._call_llm(prompt)
+        await asyncio.to_thread(self._cache.put, key, response)
+        return response
     
     async def _call_llm(self, prompt: str) -> str:
         """
         Call the LLM API (OpenAI, Anthropic, or Hugging Face).
+        
+        Calls are capped in number of simultaneous requests, and every HTTP
+        attempt (retries included) is paced by the shared token bucket, so
+        concurrent analyses stay within the provider's rate limits.
+        Transient HTTP failures are retried; after repeated failures the
+        shared circuit breaker opens.
+        
+        Raises:
+            CircuitOpenError: While the provider circuit is open
         """
-        client = await self._get_client()
-        
-        if self.provider == "openai":
-            return await self._call_openai(client, prompt)
-        elif self.provider == "anthropic":
-            return await self._call_anthropic(client, prompt)
-        elif self.provider == "huggingface":
-            return await self._call_huggingface(client, prompt)
-        else:
-            raise ValueError(f"Unknown LLM provider: {self.provider}")
+        breaker = get_llm_circuit_breaker()
+        if breaker.is_open:
+            raise CircuitOpenError("LLM provider circuit is open")
+        
+        async with get_llm_concurrency_limiter():
+            client = await self._get_client()
+            
+            try:
+                if self._provider_call is None:
+                    raise ValueError(f"Unknown LLM provider: {self.provider}")
+                response = await self._provider_call(client, prompt)
+            except Exception:
+                breaker.record_failure()
+                raise
+            
+            breaker.record_success()
+            return response
+    
+    @staticmethod
+    async def _post(
+        client: httpx.AsyncClient,
+        url: str,
+        prompt: str,
+        **kwargs: Any
+    ) -> httpx.Response:
+        """POST to the provider with retries, pacing each attempt for prompt."""
+        return await post_with_retry(
+            client,
+            url,
+            rate_limiter=get_llm_rate_limiter(),
+            estimated_tokens=_SYSTEM_PROMPT_TOKENS + estimate_tokens(prompt, LLM_MAX_TOKENS),
+            **kwargs
+        )
     
     async def _call_huggingface(self, client: httpx.AsyncClient, prompt: str) -> str:
-        """Call Hugging Face Inference API (using new router.huggingface.co endpoint)."""
+        """
+        Call Hugging Face Inference API (using new router.huggingface.co endpoint).
+        
+        Chat completions are tried first. Models that reject them are
+        remembered, so later calls go straight to text generation instead
+        of paying a failed round-trip every time.
+        """
         logger.info(f"Calling Hugging Face model: {self.model}")
         
+        if self.model not in _HF_TEXT_ONLY_MODELS:
+            content = await self._call_huggingface_chat(client, prompt)
+            if content is not None:
+                return content
+        
+        return await self._call_huggingface_text(client, prompt)
+    
+    async def _call_huggingface_chat(
+        self,
+        client: httpx.AsyncClient,
+        prompt: str
+    ) -> Optional[str]:
+        """Hugging Face chat completion; None if the caller should fall back."""
         # Format prompt for chat completion
         messages = [
-            {"role": "system", "content": "You are an expert UIDAI data analyst. Analyze the data patterns and provide insights in valid JSON format."},
+            {"role": "system", "content": _SYSTEM_PROMPT},
             {"role": "user", "content": prompt}
         ]
         
         # Try the new HuggingFace router API first (v1/chat/completions)
         try:
-            response = await client.post(
+            response = await self._post(
+                client,
                 "https://router.huggingface.co/v1/chat/completions",
+                prompt,
                 headers={
                     "Authorization": f"Bearer {self.api_key}",
                     "Content-Type": "application/json"
                 },
-                json={
+                content=json_dumps({
                     "model": self.model,
                     "messages": messages,
-                    "max_tokens": 4000,
-                    "temperature": 0.7,
+                    "max_tokens": LLM_MAX_TOKENS,
+                    "temperature": LLM_TEMPERATURE,
                     "stream": False
-                },
+                }),
                 timeout=120.0
             )
             
@@ -356,31 +626,35 @@ IMPORTANT: Respond ONLY with valid JSON. No markdown, no explanations outside JS
                     return result["choices"][0]["message"]["content"]
             else:
                 logger.warning(f"Router API returned {response.status_code}, trying inference endpoint")
+                if response.status_code in _HF_CHAT_UNSUPPORTED_STATUS:
+                    _HF_TEXT_ONLY_MODELS.add(self.model)
         except Exception as e:
             logger.warning(f"Chat completion failed, trying inference endpoint: {e}")
         
-        # Fallback to router inference API
+        return None
+    
+    async def _call_huggingface_text(self, client: httpx.AsyncClient, prompt: str) -> str:
+        """Hugging Face text generation via the router inference API."""
         api_url = f"https://router.huggingface.co/hf-inference/models/{self.model}"
         
-        full_prompt = f"""<|begin_of_text|><|start_header_id|>system<|end_header_id|>
-You are an expert UIDAI data analyst. Analyze the data patterns and provide insights in valid JSON format.<|eot_id|><|start_header_id|>user<|end_header_id|>
-{prompt}<|eot_id|><|start_header_id|>assistant<|end_header_id|>
-"""
+        full_prompt = _LLAMA_PROMPT_HEADER + prompt + _LLAMA_PROMPT_FOOTER
         
-        response = await client.post(
+        response = await self._post(
+            client,
             api_url,
+            prompt,
             headers={
                 "Authorization": f"Bearer {self.api_key}",
                 "Content-Type": "application/json"
             },
-            json={
+            content=json_dumps({
                 "inputs": full_prompt,
                 "parameters": {
-                    "max_new_tokens": 4000,
-                    "temperature": 0.7,
+                    "max_new_tokens": LLM_MAX_TOKENS,
+                    "temperature": LLM_TEMPERATURE,
                     "return_full_text": False
                 }
-            },
+            }),
             timeout=120.0
         )
         
@@ -400,22 +674,24 @@ You are an expert UIDAI data analyst. Analyze the data patterns and provide insi
     
     async def _call_openai(self, client: httpx.AsyncClient, prompt: str) -> str:
         """Call OpenAI API."""
-        response = await client.post(
+        response = await self._post(
+            client,
             "https://api.openai.com/v1/chat/completions",
+            prompt,
             headers={
                 "Authorization": f"Bearer {self.api_key}",
                 "Content-Type": "application/json"
             },
-            json={
+            content=json_dumps({
                 "model": self.model,
                 "messages": [
-                    {"role": "system", "content": "You are an expert UIDAI data analyst. Always respond with valid JSON."},
+                    {"role": "system", "content": _SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
-                "temperature": 0.7,
-                "max_tokens": 4000,
+                "temperature": LLM_TEMPERATURE,
+                "max_tokens": LLM_MAX_TOKENS,
                 "response_format": {"type": "json_object"}
-            }
+            })
         )
         
         if response.status_code != 200:
@@ -426,20 +702,26 @@ You are an expert UIDAI data analyst. Analyze the data patterns and provide insi
     
     async def _call_anthropic(self, client: httpx.AsyncClient, prompt: str) -> str:
         """Call Anthropic API."""
-        response = await client.post(
+        response = await self._post(
+            client,
             "https://api.anthropic.com/v1/messages",
+            prompt,
             headers={
                 "x-api-key": self.api_key,
                 "Content-Type": "application/json",
                 "anthropic-version": "2023-06-01"
             },
-            json={
+            content=json_dumps({
                 "model": self.model,
-                "max_tokens": 4000,
+                "max_tokens": LLM_MAX_TOKENS,
+                # Mark the fixed instructions as a cacheable prefix
+                "system": [
+                    {"type": "text", "text": _SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}
+                ],
                 "messages": [
                     {"role": "user", "content": prompt}
                 ]
-            }
+            })
         )
         
         if response.status_code != 200:
@@ -458,35 +740,35 @@ You are an expert UIDAI data analyst. Analyze the data patterns and provide insi
         """
         try:
             # Extract JSON from response
-            json_match = re.search(r'\{[\s\S]*\}', response)
-            if json_match:
-                data = json.loads(json_match.group())
-            else:
-                raise ValueError("No JSON found in response")
+            data = _extract_json_object(response)
             
-            # Parse contextual factors
-            contextual_factors = []
-            for cf in data.get("contextual_factors", []):
-                contextual_factors.append(ContextualFactor(
-                    factor_type=cf.get("factor_type", "other"),
-                    description=cf.get("description", ""),
-                    relevance_score=cf.get("relevance_score", 0.5),
-                    source=cf.get("source"),
-                    date=cf.get("date")
-                ))
+            # Parse contextual factors (validated as one list)
+            contextual_factors = _CONTEXTUAL_FACTORS_ADAPTER.validate_python([
+                {
+                    "factor_type": _closed_choice(cf.get("factor_type"), _FACTOR_TYPES, "other"),
+                    "description": cf.get("description", ""),
+                    "relevance_score": cf.get("relevance_score", 0.5),
+                    "source": cf.get("source"),
+                    "date": cf.get("date")
+                }
+                for cf in data.get("contextual_factors", [])
+            ])
             
             # Parse recommendations
-            recommendations = []
-            for rec in data.get("recommendations", []):
-                recommendations.append(StrategicRecommendation(
-                    priority=rec.get("priority", 3),
-                    recommendation=rec.get("recommendation", ""),
-                    rationale=rec.get("rationale", ""),
-                    expected_impact=rec.get("expected_impact", ""),
-                    implementation_complexity=rec.get("implementation_complexity", "medium"),
-                    affected_regions=rec.get("affected_regions", []),
-                    timeline=rec.get("timeline", "")
-                ))
+            recommendations = _RECOMMENDATIONS_ADAPTER.validate_python([
+                {
+                    "priority": rec.get("priority", 3),
+                    "recommendation": rec.get("recommendation", ""),
+                    "rationale": rec.get("rationale", ""),
+                    "expected_impact": rec.get("expected_impact", ""),
+                    "implementation_complexity": _closed_choice(
+                        rec.get("implementation_complexity"), _COMPLEXITY_LEVELS, "medium"
+                    ),
+                    "affected_regions": rec.get("affected_regions", []),
+                    "timeline": rec.get("timeline", "")
+                }
+                for rec in data.get("recommendations", [])
+            ])
             
             # Sort recommendations by priority
             recommendations.sort(key=lambda x: x.priority)
@@ -559,7 +841,7 @@ You are an expert UIDAI data analyst. Analyze the data patterns and provide insi
         
         # Analyze volatility - only flag truly high volatility regions (CV > 0.5)
         if abstract.volatility_findings.high_volatility_regions:
-            regions = abstract.volatility_findings.high_volatility_regions[:3]
+            regions = set(abstract.volatility_findings.high_volatility_regions[:3])
             # Get actual volatility scores
             high_cv_regions = [
                 r for r in abstract.volatility_findings.regional_scores 
@@ -587,7 +869,7 @@ You are an expert UIDAI data analyst. Analyze the data patterns and provide insi
         # Analyze anomalies
         critical_anomalies = [
             a for a in abstract.anomaly_findings.anomalies 
-            if a.severity.value in ["critical", "high"]
+            if a.severity in _HIGH_RISK_LEVELS
         ]
         if critical_anomalies:
             findings.append(f"{len(critical_anomalies)} critical/high severity anomalies detected")
@@ -602,7 +884,7 @@ You are an expert UIDAI data analyst. Analyze the data patterns and provide insi
                 "timeline": "Immediate"
             })
         
-        return json.dumps({
+        return json_dumps({
             "executive_summary": " ".join(findings) if findings else "Analysis complete with no major concerns.",
             "root_causes": root_causes,
             "contextual_factors": [
@@ -611,7 +893,7 @@ You are an expert UIDAI data analyst. Analyze the data patterns and provide insi
             "recommendations": recommendations,
             "risk_assessment": "Medium risk if identified issues are not addressed within recommended timeline.",
             "confidence_score": 0.6
-        })
+        }).decode()
     
     def _apply_differential_privacy(
         self,
@@ -620,23 +902,32 @@ You are an expert UIDAI data analyst. Analyze the data patterns and provide insi
         """
         Apply differential privacy noise to prevent reverse-engineering.
         
-        Noisy Output = True Output + Laplace(0, b/ε)
-        """
-        import numpy as np
+        Noisy Output = True Output + Laplace(0, Δ/ε)
         
+        With the Gaussian mechanism, the noise is instead
+        N(0, σ²) with σ = sqrt(2·ln(1.25/δ))·Δ/ε, giving (ε, δ)-DP.
+        Scores lie in [0, 1]; the sensitivity Δ is taken as 0.1.
+        """
         # Add noise to numerical values
-        noise_scale = 1.0 / self.epsilon
+        sensitivity = 0.1
+        factors = output.contextual_factors
         
-        # Perturb confidence score slightly
-        noisy_confidence = output.confidence_score + np.random.laplace(0, noise_scale * 0.1)
-        noisy_confidence = max(0.0, min(1.0, noisy_confidence))
+        # Confidence score and every relevance score, perturbed in one draw
+        scores = np.array(
+            [output.confidence_score, *(f.relevance_score for f in factors)],
+            dtype=np.float64
+        )
+        if self.dp_mechanism == "gaussian":
+            sigma = math.sqrt(2 * math.log(1.25 / self.dp_delta)) * sensitivity / self.epsilon
+            noise = _DP_RNG.normal(0.0, sigma, size=scores.size)
+        else:
+            noise = _DP_RNG.laplace(0.0, sensitivity / self.epsilon, size=scores.size)
+        noisy = np.clip(scores + noise, 0.0, 1.0).tolist()
         
-        # Perturb relevance scores
-        for factor in output.contextual_factors:
-            noisy_relevance = factor.relevance_score + np.random.laplace(0, noise_scale * 0.1)
-            factor.relevance_score = max(0.0, min(1.0, noisy_relevance))
+        for factor, noisy_relevance in zip(factors, noisy[1:]):
+            factor.relevance_score = noisy_relevance
         
-        output.confidence_score = round(noisy_confidence, 2)
+        output.confidence_score = round(noisy[0], 2)
         
         return output
     
@@ -653,16 +944,22 @@ You are an expert UIDAI data analyst. Analyze the data patterns and provide insi
         root_causes = []
         recommendations = []
         
-        if abstract.anomaly_findings.total_anomalies > 0:
+        # Counts and region lists used by several sections, looked up once
+        anomaly_findings = abstract.anomaly_findings
+        severity_dist = anomaly_findings.severity_distribution
+        critical_count = severity_dist.get('critical', 0)
+        high_count = severity_dist.get('high', 0)
+        high_vol_regions = abstract.volatility_findings.high_volatility_regions
+        region_count = len(high_vol_regions)
+        top_vol_regions = high_vol_regions[:5]
+        strong_correlations = abstract.correlation_findings.strong_correlations
+        outlier_clusters = abstract.dimensional_findings.outlier_clusters
+        
+        if anomaly_findings.total_anomalies > 0:
             summary_parts.append(
-                f"Detected {abstract.anomaly_findings.total_anomalies} anomalies across the dataset"
+                f"Detected {anomaly_findings.total_anomalies} anomalies across the dataset"
             )
             
-            # Analyze anomaly severity distribution
-            severity_dist = abstract.anomaly_findings.severity_distribution
-            critical_count = severity_dist.get('critical', 0)
-            high_count = severity_dist.get('high', 0)
-            
             if critical_count > 0:
                 root_causes.append(f"Critical data quality issues: {critical_count} critical anomalies detected requiring immediate attention")
                 recommendations.append(
@@ -672,7 +969,7 @@ You are an expert UIDAI data analyst. Analyze the data patterns and provide insi
                         rationale="Critical anomalies indicate severe data quality issues or operational problems",
                         expected_impact="Prevent data corruption and ensure data integrity",
                         implementation_complexity="high",
-                        affected_regions=abstract.volatility_findings.high_volatility_regions[:5] if abstract.volatility_findings.high_volatility_regions else [],
+                        affected_regions=top_vol_regions,
                         timeline="24-48 hours"
                     )
                 )
@@ -680,8 +977,7 @@ You are an expert UIDAI data analyst. Analyze the data patterns and provide insi
             if high_count > 10:
                 root_causes.append(f"Systematic data inconsistencies: {high_count} high-severity anomalies suggest pattern-based issues")
         
-        if abstract.volatility_findings.high_volatility_regions:
-            region_count = len(abstract.volatility_findings.high_volatility_regions)
+        if high_vol_regions:
             summary_parts.append(
                 f"High volatility detected in {region_count} regions, indicating unstable patterns"
             )
@@ -690,51 +986,48 @@ You are an expert UIDAI data analyst. Analyze the data patterns and provide insi
             recommendations.append(
                 StrategicRecommendation(
                     priority=2,
-                    recommendation=f"Stabilize operations in {', '.join(abstract.volatility_findings.high_volatility_regions[:3])}",
+                    recommendation=f"Stabilize operations in {', '.join(high_vol_regions[:3])}",
                     rationale="High volatility regions show unpredictable patterns that may indicate operational issues",
                     expected_impact="Improved consistency and predictability in enrollment patterns",
                     implementation_complexity="medium",
-                    affected_regions=abstract.volatility_findings.high_volatility_regions[:5],
+                    affected_regions=top_vol_regions,
                     timeline="1-2 weeks"
                 )
             )
         
-        if abstract.correlation_findings.strong_correlations:
-            corr_count = len(abstract.correlation_findings.strong_correlations)
+        if strong_correlations:
             summary_parts.append(
-                f"Identified {corr_count} significant correlations between variables"
+                f"Identified {len(strong_correlations)} significant correlations between variables"
             )
             
             # Extract key correlations
-            top_correlations = abstract.correlation_findings.strong_correlations[:3]
-            if top_correlations:
-                corr_desc = []
-                for corr in top_correlations:
-                    corr_desc.append(f"{corr.variable1} ↔ {corr.variable2} (strength: {abs(corr.correlation_value):.2f})")
-                root_causes.append(f"Key relationships found: {'; '.join(corr_desc)}")
-                
-                recommendations.append(
-                    StrategicRecommendation(
-                        priority=3,
-                        recommendation="Leverage identified correlations to optimize resource allocation",
-                        rationale=f"Strong correlations suggest predictable patterns that can guide planning",
-                        expected_impact="More efficient resource distribution based on data-driven insights",
-                        implementation_complexity="low",
-                        affected_regions=[],
-                        timeline="2-4 weeks"
-                    )
+            corr_desc = "; ".join(
+                f"{corr.variable_1} ↔ {corr.variable_2} (strength: {abs(corr.correlation_coefficient):.2f})"
+                for corr in strong_correlations[:3]
+            )
+            root_causes.append(f"Key relationships found: {corr_desc}")
+            
+            recommendations.append(
+                StrategicRecommendation(
+                    priority=3,
+                    recommendation="Leverage identified correlations to optimize resource allocation",
+                    rationale=f"Strong correlations suggest predictable patterns that can guide planning",
+                    expected_impact="More efficient resource distribution based on data-driven insights",
+                    implementation_complexity="low",
+                    affected_regions=[],
+                    timeline="2-4 weeks"
                 )
+            )
         
-        if abstract.dimensional_findings.outlier_clusters:
-            cluster_count = len(abstract.dimensional_findings.outlier_clusters)
+        if outlier_clusters:
             summary_parts.append(
-                f"Found {cluster_count} dimensional outlier clusters requiring attention"
+                f"Found {len(outlier_clusters)} dimensional outlier clusters requiring attention"
             )
             
             # Analyze high-risk clusters
-            high_risk_clusters = [c for c in abstract.dimensional_findings.outlier_clusters if c.risk_level in ['critical', 'high']]
-            if high_risk_clusters:
-                root_causes.append(f"Multi-dimensional anomalies: {len(high_risk_clusters)} clusters show compound risk factors")
+            high_risk_count = sum(1 for c in outlier_clusters if c.risk_level in _HIGH_RISK_LEVELS)
+            if high_risk_count:
+                root_causes.append(f"Multi-dimensional anomalies: {high_risk_count} clusters show compound risk factors")
         
         # If no specific issues found
         if not root_causes:
@@ -758,18 +1051,15 @@ You are an expert UIDAI data analyst. Analyze the data patterns and provide insi
         summary = ". ".join(summary_parts) if summary_parts else "Analysis completed - data shows normal patterns."
         
         # Generate risk assessment
-        total_critical = abstract.anomaly_findings.severity_distribution.get('critical', 0)
-        total_high = abstract.anomaly_findings.severity_distribution.get('high', 0)
-        
-        if total_critical > 0:
+        if critical_count > 0:
             risk_level = "HIGH RISK"
-            risk_desc = f"Immediate action required: {total_critical} critical issues detected"
-        elif total_high > 20:
+            risk_desc = f"Immediate action required: {critical_count} critical issues detected"
+        elif high_count > 20:
             risk_level = "MODERATE-HIGH RISK"
-            risk_desc = f"Elevated risk level with {total_high} high-severity issues"
-        elif abstract.volatility_findings.high_volatility_regions:
+            risk_desc = f"Elevated risk level with {high_count} high-severity issues"
+        elif high_vol_regions:
             risk_level = "MODERATE RISK"
-            risk_desc = f"Some instability detected in {len(abstract.volatility_findings.high_volatility_regions)} regions"
+            risk_desc = f"Some instability detected in {region_count} regions"
         else:
             risk_level = "LOW RISK"
             risk_desc = "Data patterns are generally stable and predictable"
@@ -10,10 +10,15 @@ This module orchestrates:
 """
 
 import asyncio
+import contextlib
+import hashlib
+import re
+import time
 import uuid
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
+import orjson
 import pandas as pd
+from cachetools import TTLCache
 from loguru import logger
 
 from app.engines import (
@@ -24,6 +29,7 @@ from app.engines import (
     AnomalyDetectionEngine
 )
 from app.services.llm_reasoning import LLMReasoningLayer
+from app.config import settings
 from app.models import (
     AnalysisPackage,
     AnalysisStatus,
@@ -31,10 +37,83 @@ from app.models import (
     VisualizationSpec,
     VisualizationType,
     DataQualityReport,
-    FileUploadResponse
+    DataSummary,
+    FileUploadResponse,
+    VolatilityScoringOutput,
+    DimensionalSlicingOutput,
+    CorrelationEngineOutput,
+    AnomalyDetectionOutput
 )
 
 
+def _name_pattern(*fragments: str) -> re.Pattern:
+    """Compile column-name fragments into a single alternation pattern."""
+    return re.compile("|".join(map(re.escape, fragments)))
+
+
+# Column-name fragments used by auto-detection (matched against lowercased names)
+_TARGET_COLUMN_RE = _name_pattern(
+    'rate', 'count', 'total', 'enrollment', 'rejection',
+    'success', 'failure', 'value', 'amount'
+)
+_REGION_COLUMN_RE = _name_pattern(
+    'state', 'district', 'region', 'city', 'location',
+    'area', 'zone', 'territory'
+)
+_TIME_COLUMN_RE = _name_pattern('date', 'time', 'month', 'year', 'period', 'quarter')
+# Common dimension column name patterns for Aadhaar data
+_DIMENSION_COLUMN_RE = _name_pattern(
+    'state', 'district', 'region', 'area', 'zone',
+    'gender', 'sex', 'age', 'group', 'category', 'type',
+    'status', 'mode', 'agency', 'operator', 'source',
+    'month', 'year', 'quarter', 'period', 'date'
+)
+# Dimensional slicing uses at most this many auto-detected columns
+_MAX_DIMENSION_COLUMNS = 5
+
+
+# Chart type, title and description for each engine's visualization, in
+# the order of the engine outputs passed to _generate_visualizations
+_ENGINE_VISUALIZATIONS = (
+    (VisualizationType.HEATMAP, "Correlation Matrix", "Pairwise correlations between variables"),
+    (VisualizationType.MAP, "Regional Volatility", "Geographic distribution of data volatility"),
+    (VisualizationType.HEATMAP, "Dimensional Analysis", "Outlier clusters across dimensions"),
+    (VisualizationType.SCATTER_PLOT, "Anomaly Detection", "Detected anomalies by severity")
+)
+
+
+def _assemble(model_cls, **fields):
+    """
+    Build an output model from already-validated parts.
+    
+    Engine outputs are validated when they are created, so the outer
+    models skip a second recursive walk unless settings.validate_responses
+    is enabled.
+    """
+    if settings.validate_responses:
+        return model_cls(**fields)
+    return model_cls.model_construct(**fields)
+
+
+# Process-wide limit on analyses running their engines at once. Created by
+# init_engine_slots() at application startup, inside the serving event loop.
+_engine_slots: Optional[asyncio.BoundedSemaphore] = None
+
+
+def init_engine_slots() -> None:
+    """
+    Create the engine-run limit for the running application.
+    
+    Each analysis fans its four engines out to worker threads; bounding
+    concurrent analyses keeps the default thread pool from being flooded.
+    Called from the lifespan handler, so every app start (and every test
+    client) gets a semaphore of its own instead of one bound to the first
+    event loop that waited on it.
+    """
+    global _engine_slots
+    _engine_slots = asyncio.BoundedSemaphore(settings.max_concurrent_engine_runs)
+
+
 class AnalysisOrchestrator:
     """
     Master orchestrator for the Aadhaar Pulse analytical pipeline.
@@ -55,6 +134,17 @@ class AnalysisOrchestrator:
         self.current_df: Optional[pd.DataFrame] = None
         self.quality_report: Optional[DataQualityReport] = None
         self.job_id: Optional[str] = None
+        
+        # Completed packages keyed by a hash of the analysis parameters
+        self._package_cache: TTLCache = TTLCache(
+            maxsize=16, ttl=settings.analysis_cache_ttl_seconds
+        )
+        
+        # Auto-detected columns for the current upload, keyed by role
+        self._detected_columns: Dict[str, Any] = {}
+        
+        # Parsed time ranges for the current upload, keyed by column
+        self._time_ranges: Dict[str, Optional[Dict[str, str]]] = {}
     
     async def ingest_file(
         self,
@@ -67,6 +157,9 @@ class AnalysisOrchestrator:
         Returns upload response with data quality report.
         """
         self.job_id = str(uuid.uuid4())
+        self._package_cache.clear()
+        self._detected_columns.clear()
+        self._time_ranges.clear()
         logger.info(f"Starting file ingestion for job {self.job_id}: {filename}")
         
         try:
@@ -104,6 +197,9 @@ class AnalysisOrchestrator:
         """
         Run the complete analytical pipeline.
         
+        Repeated calls with the same parameters on the same upload return
+        the cached package (see settings.analysis_cache_mode).
+        
         Args:
             target_column: Primary metric column to analyze
             region_column: Column containing geographic regions
@@ -117,96 +213,90 @@ class AnalysisOrchestrator:
         if self.current_df is None:
             raise ValueError("No data loaded. Call ingest_file first.")
         
-        start_time = datetime.utcnow()
+        cache_mode = settings.analysis_cache_mode
+        cache_key = self._package_cache_key(
+            target_column, region_column, time_column, dimension_columns, run_llm
+        )
+        if cache_mode == "enabled" and cache_key in self._package_cache:
+            logger.info(f"Returning cached analysis package for job {self.job_id}")
+            return self._package_cache[cache_key]
+        
+        package = await self._run_pipeline(
+            target_column, region_column, time_column, dimension_columns, run_llm
+        )
+        if cache_mode == "enabled":
+            self._package_cache[cache_key] = package
+        
+        return package
+    
+    def _package_cache_key(
+        self,
+        target_column: Optional[str],
+        region_column: Optional[str],
+        time_column: Optional[str],
+        dimension_columns: Optional[List[str]],
+        run_llm: bool
+    ) -> str:
+        """SHA-256 over the job and the requested analysis parameters."""
+        params = {
+            "job_id": self.job_id,
+            "target": target_column,
+            "region": region_column,
+            "time": time_column,
+            "dimensions": dimension_columns,
+            "run_llm": run_llm
+        }
+        return hashlib.sha256(orjson.dumps(params, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    
+    async def _run_pipeline(
+        self,
+        target_column: Optional[str],
+        region_column: Optional[str],
+        time_column: Optional[str],
+        dimension_columns: Optional[List[str]],
+        run_llm: bool
+    ) -> AnalysisPackage:
+        """Run every engine and the reasoning layer, then assemble the package."""
+        start_time = time.perf_counter()
         logger.info(f"Starting full analysis for job {self.job_id}")
         
         # Auto-detect columns if not provided
-        target_column = target_column or self._auto_detect_target_column()
-        region_column = region_column or self._auto_detect_region_column()
-        time_column = time_column or self._auto_detect_time_column()
-        dimension_columns = dimension_columns or self._auto_detect_dimension_columns()
+        target_column = target_column or self._detect_column("target", self._auto_detect_target_column)
+        region_column = region_column or self._detect_column("region", self._auto_detect_region_column)
+        time_column = time_column or self._detect_column("time", self._auto_detect_time_column)
+        dimension_columns = dimension_columns or self._detect_column(
+            "dimensions", self._auto_detect_dimension_columns
+        )
         
         # Get numeric columns for correlation and anomaly detection
         numeric_columns = self.quality_report.numeric_columns if self.quality_report else []
         
-        # Run analytical engines (can be parallelized)
         try:
-            # Correlation Analysis
-            correlation_output = self.correlation_engine.analyze(
-                self.current_df,
-                target_column=target_column
-            )
-            logger.info("Correlation analysis complete")
-            
-            # Volatility Analysis (if region column exists)
-            if region_column and target_column:
-                volatility_output = self.volatility_engine.analyze(
-                    self.current_df,
-                    metric_column=target_column,
-                    region_column=region_column,
-                    time_column=time_column
-                )
-            else:
-                volatility_output = self.volatility_engine._empty_output() if hasattr(self.volatility_engine, '_empty_output') else None
-                if volatility_output is None:
-                    from app.models import VolatilityScoringOutput
-                    volatility_output = VolatilityScoringOutput(
-                        regional_scores=[],
-                        high_volatility_regions=[],
-                        stable_regions=[],
-                        temporal_patterns={},
-                        seasonality_detected=False,
-                        summary="Insufficient data for volatility analysis",
-                        visualization={}
+            # The engines are independent; NumPy/pandas release the GIL, so
+            # running them in worker threads overlaps their CPU time
+            # Unbounded when used outside the app (scripts, tests)
+            async with _engine_slots or contextlib.nullcontext():
+                (
+                    correlation_output,
+                    volatility_output,
+                    dimensional_output,
+                    anomaly_output
+                ) = await asyncio.gather(
+                    asyncio.to_thread(self._run_correlation, target_column),
+                    asyncio.to_thread(
+                        self._run_volatility, target_column, region_column, time_column
+                    ),
+                    asyncio.to_thread(
+                        self._run_dimensional, target_column, dimension_columns
+                    ),
+                    asyncio.to_thread(
+                        self._run_anomaly, numeric_columns, region_column, time_column
                     )
-            logger.info("Volatility analysis complete")
-            
-            # Dimensional Slicing (if dimension columns exist)
-            logger.info(f"Dimension columns detected: {dimension_columns}")
-            logger.info(f"Target column: {target_column}")
-            if dimension_columns and target_column and len(dimension_columns) >= 2:
-                try:
-                    dimensional_output = self.dimensional_engine.analyze(
-                        self.current_df,
-                        metric_column=target_column,
-                        dimension_columns=dimension_columns
-                    )
-                    logger.info(f"Dimensional analysis found {len(dimensional_output.outlier_clusters)} outlier clusters")
-                except Exception as e:
-                    logger.error(f"Dimensional analysis failed: {e}")
-                    from app.models import DimensionalSlicingOutput
-                    dimensional_output = DimensionalSlicingOutput(
-                        aggregations=[],
-                        outlier_clusters=[],
-                        top_anomalies=[],
-                        dimension_importance={},
-                        summary=f"Dimensional analysis failed: {str(e)}",
-                        visualization={}
-                    )
-            else:
-                logger.warning(f"Skipping dimensional analysis - need >= 2 dimensions, got {len(dimension_columns) if dimension_columns else 0}")
-                from app.models import DimensionalSlicingOutput
-                dimensional_output = DimensionalSlicingOutput(
-                    aggregations=[],
-                    outlier_clusters=[],
-                    top_anomalies=[],
-                    dimension_importance={},
-                    summary="Insufficient dimension columns for analysis",
-                    visualization={}
                 )
-            logger.info("Dimensional slicing complete")
-            
-            # Anomaly Detection
-            anomaly_output = self.anomaly_engine.analyze(
-                self.current_df,
-                metric_columns=numeric_columns[:10],  # Limit to avoid overload
-                region_column=region_column,
-                time_column=time_column
-            )
-            logger.info("Anomaly detection complete")
             
             # Create statistical abstract
-            statistical_abstract = StatisticalAbstract(
+            statistical_abstract = _assemble(
+                StatisticalAbstract,
                 correlation_findings=correlation_output,
                 volatility_findings=volatility_output,
                 dimensional_findings=dimensional_output,
@@ -240,31 +330,136 @@ class AnalysisOrchestrator:
             )
             
             # Calculate processing time
-            processing_time = (datetime.utcnow() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             
             # Assemble final package
-            return AnalysisPackage(
+            return _assemble(
+                AnalysisPackage,
                 job_id=self.job_id,
                 status=AnalysisStatus.COMPLETED,
-                data_summary={
-                    "total_records": len(self.current_df),
-                    "total_columns": len(self.current_df.columns),
-                    "numeric_columns": numeric_columns,
-                    "target_column": target_column,
-                    "region_column": region_column,
-                    "time_column": time_column
-                },
+                data_summary=DataSummary(
+                    total_records=len(self.current_df),
+                    total_columns=len(self.current_df.columns),
+                    numeric_columns=numeric_columns,
+                    target_column=target_column,
+                    region_column=region_column,
+                    time_column=time_column
+                ),
                 statistical_abstract=statistical_abstract,
                 intelligence_report=intelligence_report,
                 visualizations=visualizations,
                 processing_time_seconds=processing_time,
-                data_quality_score=self.quality_report.quality_score if self.quality_report else 0
+                data_quality_score=float(self.quality_report.quality_score) if self.quality_report else 0.0
             )
             
         except Exception as e:
             logger.error(f"Analysis failed: {e}")
             raise
     
+    def _run_correlation(self, target_column: Optional[str]) -> CorrelationEngineOutput:
+        """Correlation analysis."""
+        correlation_output = self.correlation_engine.analyze(
+            self.current_df,
+            target_column=target_column
+        )
+        logger.info("Correlation analysis complete")
+        return correlation_output
+    
+    def _run_volatility(
+        self,
+        target_column: Optional[str],
+        region_column: Optional[str],
+        time_column: Optional[str]
+    ) -> VolatilityScoringOutput:
+        """Volatility analysis (if region column exists)."""
+        if region_column and target_column:
+            volatility_output = self.volatility_engine.analyze(
+                self.current_df,
+                metric_column=target_column,
+                region_column=region_column,
+                time_column=time_column
+            )
+        else:
+            volatility_output = self.volatility_engine._empty_output() if hasattr(self.volatility_engine, '_empty_output') else None
+            if volatility_output is None:
+                volatility_output = VolatilityScoringOutput(
+                    regional_scores=[],
+                    high_volatility_regions=[],
+                    stable_regions=[],
+                    temporal_patterns={},
+                    seasonality_detected=False,
+                    summary="Insufficient data for volatility analysis",
+                    visualization={}
+                )
+        logger.info("Volatility analysis complete")
+        return volatility_output
+    
+    def _run_dimensional(
+        self,
+        target_column: Optional[str],
+        dimension_columns: List[str]
+    ) -> DimensionalSlicingOutput:
+        """Dimensional slicing (if dimension columns exist)."""
+        logger.info(f"Dimension columns detected: {dimension_columns}")
+        logger.info(f"Target column: {target_column}")
+        if dimension_columns and target_column and len(dimension_columns) >= 2:
+            try:
+                dimensional_output = self.dimensional_engine.analyze(
+                    self.current_df,
+                    metric_column=target_column,
+                    dimension_columns=dimension_columns
+                )
+                logger.info(f"Dimensional analysis found {len(dimensional_output.outlier_clusters)} outlier clusters")
+            except Exception as e:
+                logger.error(f"Dimensional analysis failed: {e}")
+                dimensional_output = DimensionalSlicingOutput(
+                    aggregations=[],
+                    outlier_clusters=[],
+                    top_anomalies=[],
+                    dimension_importance={},
+                    summary=f"Dimensional analysis failed: {str(e)}",
+                    visualization={}
+                )
+        else:
+            logger.warning(f"Skipping dimensional analysis - need >= 2 dimensions, got {len(dimension_columns) if dimension_columns else 0}")
+            dimensional_output = DimensionalSlicingOutput(
+                aggregations=[],
+                outlier_clusters=[],
+                top_anomalies=[],
+                dimension_importance={},
+                summary="Insufficient dimension columns for analysis",
+                visualization={}
+            )
+        logger.info("Dimensional slicing complete")
+        return dimensional_output
+    
+    def _run_anomaly(
+        self,
+        numeric_columns: List[str],
+        region_column: Optional[str],
+        time_column: Optional[str]
+    ) -> AnomalyDetectionOutput:
+        """Anomaly detection."""
+        anomaly_output = self.anomaly_engine.analyze(
+            self.current_df,
+            metric_columns=numeric_columns[:10],  # Limit to avoid overload
+            region_column=region_column,
+            time_column=time_column
+        )
+        logger.info("Anomaly detection complete")
+        return anomaly_output
+    
+    def _detect_column(self, role: str, detector: Callable[[], Any]) -> Any:
+        """
+        Run a column detector once per upload.
+        
+        Detection depends only on the ingested frame, so re-runs with
+        different parameters (e.g. run_llm) reuse the first result.
+        """
+        if role not in self._detected_columns:
+            self._detected_columns[role] = detector()
+        return self._detected_columns[role]
+    
     def _auto_detect_target_column(self) -> Optional[str]:
         """Auto-detect the primary metric column."""
         if self.current_df is None or self.quality_report is None:
@@ -273,16 +468,9 @@ class AnalysisOrchestrator:
         numeric_cols = self.quality_report.numeric_columns
         
         # Look for common metric patterns
-        metric_patterns = [
-            'rate', 'count', 'total', 'enrollment', 'rejection',
-            'success', 'failure', 'value', 'amount'
-        ]
-        
         for col in numeric_cols:
-            col_lower = col.lower()
-            for pattern in metric_patterns:
-                if pattern in col_lower:
-                    return col
+            if _TARGET_COLUMN_RE.search(col.lower()):
+                return col
         
         # Default to first numeric column
         return numeric_cols[0] if numeric_cols else None
@@ -295,16 +483,9 @@ class AnalysisOrchestrator:
         categorical_cols = self.quality_report.categorical_columns
         
         # Look for common region patterns
-        region_patterns = [
-            'state', 'district', 'region', 'city', 'location',
-            'area', 'zone', 'territory'
-        ]
-        
         for col in categorical_cols:
-            col_lower = col.lower()
-            for pattern in region_patterns:
-                if pattern in col_lower:
-                    return col
+            if _REGION_COLUMN_RE.search(col.lower()):
+                return col
         
         return None
     
@@ -318,13 +499,9 @@ class AnalysisOrchestrator:
             return self.quality_report.date_columns[0]
         
         # Look for time patterns in other columns
-        time_patterns = ['date', 'time', 'month', 'year', 'period', 'quarter']
-        
         for col in self.current_df.columns:
-            col_lower = col.lower()
-            for pattern in time_patterns:
-                if pattern in col_lower:
-                    return col
+            if _TIME_COLUMN_RE.search(col.lower()):
+                return col
         
         return None
     
@@ -335,34 +512,30 @@ class AnalysisOrchestrator:
         
         dimension_cols = []
         
-        # Common dimension column name patterns for Aadhaar data
-        dimension_patterns = [
-            'state', 'district', 'region', 'area', 'zone',
-            'gender', 'sex', 'age', 'group', 'category', 'type',
-            'status', 'mode', 'agency', 'operator', 'source',
-            'month', 'year', 'quarter', 'period', 'date'
-        ]
-        
         logger.info(f"DataFrame columns: {list(self.current_df.columns)}")
         logger.info(f"Categorical columns from quality report: {self.quality_report.categorical_columns}")
         
+        # Cardinality of every column in one pass, shared by all checks below
+        unique_counts = self.current_df.nunique()
+        
         # First check all columns by name pattern (regardless of dtype)
         for col in self.current_df.columns:
-            col_lower = col.lower()
-            unique_count = self.current_df[col].nunique()
+            unique_count = unique_counts[col]
             
             # Check if column name matches dimension patterns
-            for pattern in dimension_patterns:
-                if pattern in col_lower and col not in dimension_cols:
-                    if 2 <= unique_count <= 500:
-                        dimension_cols.append(col)
-                        logger.info(f"Added '{col}' as dimension (pattern match: {pattern}, {unique_count} unique)")
-                        break
+            match = _DIMENSION_COLUMN_RE.search(col.lower())
+            if match and 2 <= unique_count <= 500:
+                dimension_cols.append(col)
+                logger.info(f"Added '{col}' as dimension (pattern match: {match.group()}, {unique_count} unique)")
+                if len(dimension_cols) >= _MAX_DIMENSION_COLUMNS:
+                    break
         
         # Then try categorical columns from quality report
         for col in self.quality_report.categorical_columns:
+            if len(dimension_cols) >= _MAX_DIMENSION_COLUMNS:
+                break
             if col not in dimension_cols:
-                unique_count = self.current_df[col].nunique()
+                unique_count = unique_counts[col]
                 logger.info(f"Categorical column '{col}': {unique_count} unique values")
                 if 2 <= unique_count <= 500:
                     dimension_cols.append(col)
@@ -373,7 +546,7 @@ class AnalysisOrchestrator:
             logger.info(f"Only {len(dimension_cols)} dimensions found, checking all object columns")
             for col in self.current_df.select_dtypes(include=['object', 'string', 'category']).columns:
                 if col not in dimension_cols:
-                    unique_count = self.current_df[col].nunique()
+                    unique_count = unique_counts[col]
                     logger.info(f"Object column '{col}': {unique_count} unique values")
                     if 2 <= unique_count <= 500:
                         dimension_cols.append(col)
@@ -384,30 +557,39 @@ class AnalysisOrchestrator:
             logger.info("Checking numeric columns with low cardinality")
             for col in self.current_df.select_dtypes(include=['int64', 'int32', 'float64']).columns:
                 if col not in dimension_cols:
-                    unique_count = self.current_df[col].nunique()
+                    unique_count = unique_counts[col]
                     if 2 <= unique_count <= 50:  # Stricter for numeric
                         dimension_cols.append(col)
                         logger.info(f"Added numeric column '{col}' as dimension ({unique_count} unique)")
         
-        logger.info(f"Final dimension columns detected: {dimension_cols[:5]}")
-        return dimension_cols[:5]  # Limit to 5 dimensions
+        logger.info(f"Final dimension columns detected: {dimension_cols[:_MAX_DIMENSION_COLUMNS]}")
+        return dimension_cols[:_MAX_DIMENSION_COLUMNS]
     
     def _get_time_range(self, time_column: Optional[str]) -> Optional[Dict[str, str]]:
-        """Get time range from data."""
+        """
+        Get time range from data.
+        
+        Parsing is the expensive part, so each column's range is computed
+        once per upload and reused by later runs.
+        """
         if time_column is None or self.current_df is None:
             return None
         
         if time_column not in self.current_df.columns:
             return None
         
-        try:
-            time_series = pd.to_datetime(self.current_df[time_column], errors='coerce')
-            return {
-                "start": str(time_series.min()),
-                "end": str(time_series.max())
-            }
-        except Exception:
-            return None
+        if time_column not in self._time_ranges:
+            try:
+                time_series = pd.to_datetime(self.current_df[time_column], errors='coerce')
+                time_range = {
+                    "start": str(time_series.min()),
+                    "end": str(time_series.max())
+                }
+            except Exception:
+                time_range = None
+            self._time_ranges[time_column] = time_range
+        
+        return self._time_ranges[time_column]
     
     def _generate_visualizations(
         self,
@@ -419,47 +601,18 @@ class AnalysisOrchestrator:
         """
         Generate visualization specifications for the frontend.
         """
-        visualizations = []
-        
-        # Correlation heatmap
-        if correlation_output.visualization:
-            visualizations.append(VisualizationSpec(
-                type=VisualizationType.HEATMAP,
-                title="Correlation Matrix",
-                description="Pairwise correlations between variables",
-                data=correlation_output.visualization.get('data', {}),
-                config=correlation_output.visualization.get('config', {})
-            ))
-        
-        # Volatility map
-        if volatility_output.visualization:
-            visualizations.append(VisualizationSpec(
-                type=VisualizationType.MAP,
-                title="Regional Volatility",
-                description="Geographic distribution of data volatility",
-                data=volatility_output.visualization.get('data', {}),
-                config=volatility_output.visualization.get('config', {})
-            ))
-        
-        # Dimensional heatmap
-        if dimensional_output.visualization:
-            visualizations.append(VisualizationSpec(
-                type=VisualizationType.HEATMAP,
-                title="Dimensional Analysis",
-                description="Outlier clusters across dimensions",
-                data=dimensional_output.visualization.get('data', {}),
-                config=dimensional_output.visualization.get('config', {})
-            ))
-        
-        # Anomaly scatter plot
-        if anomaly_output.visualization:
-            visualizations.append(VisualizationSpec(
-                type=VisualizationType.SCATTER_PLOT,
-                title="Anomaly Detection",
-                description="Detected anomalies by severity",
-                data=anomaly_output.visualization.get('data', {}),
-                config=anomaly_output.visualization.get('config', {})
-            ))
+        engine_outputs = (correlation_output, volatility_output, dimensional_output, anomaly_output)
+        visualizations = [
+            VisualizationSpec(
+                type=viz_type,
+                title=title,
+                description=description,
+                data=output.visualization.get('data', {}),
+                config=output.visualization.get('config', {})
+            )
+            for output, (viz_type, title, description) in zip(engine_outputs, _ENGINE_VISUALIZATIONS)
+            if output.visualization
+        ]
         
         # Add summary charts
         if self.current_df is not None and self.quality_report:
@@ -484,3 +637,5 @@ class AnalysisOrchestrator:
         await self.llm_layer.close()
         self.current_df = None
         self.quality_report = None
+        self._detected_columns.clear()
+        self._time_ranges.clear()
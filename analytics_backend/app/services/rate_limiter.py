@@ -0,0 +1,121 @@
+"""
+LLM Rate Limiter - Token Bucket Pacing for Provider Calls
+
+Concurrent analyses share one provider quota. Pacing requests locally
+keeps the backend under the provider's requests-per-minute and
+tokens-per-minute limits instead of spending wall-clock time on 429
+retries and backoff. A semaphore additionally caps how many provider
+calls are in flight at once.
+"""
+
+import asyncio
+import contextlib
+import time
+from typing import AsyncContextManager, Optional
+
+from loguru import logger
+
+from app.config import settings
+
+
+class TokenBucket:
+    """
+    Dual token bucket limiting requests and tokens per minute.
+    
+    Both buckets start full and refill continuously at their per-minute
+    rate. acquire() waits until one request slot and the estimated number
+    of tokens are available, then consumes them.
+    """
+    
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        self.request_capacity = float(requests_per_minute)
+        self.token_capacity = float(tokens_per_minute)
+        self._request_rate = self.request_capacity / 60.0  # per second
+        self._token_rate = self.token_capacity / 60.0
+        
+        self._requests = self.request_capacity
+        self._tokens = self.token_capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(self.request_capacity, self._requests + elapsed * self._request_rate)
+        self._tokens = min(self.token_capacity, self._tokens + elapsed * self._token_rate)
+    
+    async def acquire(self, estimated_tokens: int) -> None:
+        """Wait until a request with estimated_tokens can be sent."""
+        # A single call larger than the whole bucket only waits for a full bucket
+        needed_tokens = min(float(estimated_tokens), self.token_capacity)
+        
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._requests >= 1.0 and self._tokens >= needed_tokens:
+                    self._requests -= 1.0
+                    self._tokens -= needed_tokens
+                    return
+                
+                wait = max(
+                    (1.0 - self._requests) / self._request_rate,
+                    (needed_tokens - self._tokens) / self._token_rate,
+                    0.0
+                )
+                logger.debug(f"LLM rate limit reached, waiting {wait:.2f}s")
+                await asyncio.sleep(wait)
+
+
+def estimate_tokens(prompt: str, max_output_tokens: int = 0) -> int:
+    """Rough token count for a prompt (~4 characters per token) plus reserved output."""
+    return len(prompt) // 4 + max_output_tokens
+
+
+# Cap on simultaneous in-flight provider calls. Created by
+# init_llm_concurrency_limiter() at application startup, inside the serving
+# event loop.
+_llm_concurrency: Optional[asyncio.Semaphore] = None
+
+
+def init_llm_concurrency_limiter() -> None:
+    """
+    Create the provider-call cap for the running application.
+    
+    Called from the lifespan handler, so every app start (and every test
+    client) gets a semaphore of its own instead of one bound to the first
+    event loop that waited on it.
+    """
+    global _llm_concurrency
+    _llm_concurrency = asyncio.Semaphore(settings.llm_max_concurrent_requests)
+
+
+def get_llm_concurrency_limiter() -> AsyncContextManager:
+    """The provider-call cap; unbounded when used outside the app (scripts, tests)."""
+    return _llm_concurrency or contextlib.nullcontext()
+
+
+# Bucket shared by every LLMReasoningLayer. Created by init_llm_rate_limiter()
+# at application startup, so its lock belongs to the serving event loop.
+_llm_rate_limiter: Optional[TokenBucket] = None
+
+
+def init_llm_rate_limiter() -> None:
+    """
+    Create the provider-quota bucket for the running application.
+    
+    The provider quota is split evenly across the configured number of
+    server worker processes. Called from the lifespan handler, so the
+    bucket's asyncio.Lock is never shared between event loops.
+    """
+    global _llm_rate_limiter
+    workers = max(1, settings.llm_rate_limit_workers)
+    _llm_rate_limiter = TokenBucket(
+        requests_per_minute=settings.llm_requests_per_minute / workers,
+        tokens_per_minute=settings.llm_tokens_per_minute / workers
+    )
+
+
+def get_llm_rate_limiter() -> Optional[TokenBucket]:
+    """The shared bucket; None (no pacing) when used outside the app (scripts, tests)."""
+    return _llm_rate_limiter
@@ -0,0 +1,155 @@
+"""
+Provider Call Resilience - Retries and Circuit Breaking
+
+Transient provider failures (429 throttling, 5xx, failed connects) are
+retried with capped exponential backoff and full jitter, or after the
+provider's Retry-After delay when one is given. Read timeouts are not
+retried: the request may still be running upstream, and each one already
+waited the full call timeout. A circuit
+breaker trips after repeated consecutive failures so that, during an
+outage, analyses go straight to rule-based reasoning instead of waiting
+on timeouts.
+"""
+
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Any, Optional
+
+import httpx
+from loguru import logger
+
+from app.config import settings
+from app.services.rate_limiter import TokenBucket
+
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+# Failures before the request reached the provider; safe and cheap to retry
+RETRYABLE_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when provider calls are short-circuited by an open breaker."""
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+    
+    The breaker opens after failure_threshold consecutive failures. Once
+    reset_timeout seconds have passed it lets a trial call through
+    (half-open): a success closes it, a failure re-opens it.
+    """
+    
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+    
+    @property
+    def is_open(self) -> bool:
+        """True while calls should be short-circuited."""
+        if self._opened_at is None:
+            return False
+        return time.monotonic() - self._opened_at < self.reset_timeout
+    
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+    
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._failures >= self.failure_threshold:
+            if self._opened_at is None:
+                logger.warning(
+                    f"LLM circuit breaker opened after {self._failures} consecutive failures"
+                )
+            self._opened_at = time.monotonic()
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Delay requested by a Retry-After header (seconds or HTTP date), if any."""
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+async def post_with_retry(
+    client: httpx.AsyncClient,
+    url: str,
+    attempts: Optional[int] = None,
+    base_delay: float = 0.25,
+    max_delay: float = 8.0,
+    max_retry_after: float = 30.0,
+    rate_limiter: Optional[TokenBucket] = None,
+    estimated_tokens: int = 0,
+    **kwargs: Any
+) -> httpx.Response:
+    """
+    POST with retries on transient failures.
+    
+    Retries RETRYABLE_ERRORS and RETRYABLE_STATUS responses. Between tries
+    it sleeps for the response's Retry-After delay when present, otherwise
+    a random fraction of min(base_delay * 2**attempt, max_delay). Any other
+    response is returned as-is for the caller to handle; after the last
+    attempt the final response (or error) is surfaced.
+    
+    Args:
+        max_retry_after: Longest Retry-After delay worth waiting for; a
+            response asking for more is returned without retrying, so the
+            request does not hold its concurrency slot for the duration
+        rate_limiter: Bucket to acquire estimated_tokens from before every
+            attempt, so retries are paced like first calls
+    """
+    attempts = attempts or settings.llm_retry_attempts
+    
+    for attempt in range(attempts):
+        last_attempt = attempt == attempts - 1
+        if rate_limiter is not None:
+            await rate_limiter.acquire(estimated_tokens)
+        
+        retry_after = None
+        try:
+            response = await client.post(url, **kwargs)
+        except RETRYABLE_ERRORS as e:
+            if last_attempt:
+                raise
+            reason = type(e).__name__
+        else:
+            if response.status_code not in RETRYABLE_STATUS or last_attempt:
+                return response
+            reason = f"HTTP {response.status_code}"
+            retry_after = _retry_after_seconds(response)
+            if retry_after is not None and retry_after > max_retry_after:
+                logger.warning(
+                    f"LLM call failed ({reason}), provider asked to retry in "
+                    f"{retry_after:.0f}s; not retrying"
+                )
+                return response
+        
+        if retry_after is not None:
+            delay = retry_after
+        else:
+            delay = random.random() * min(base_delay * 2 ** attempt, max_delay)
+        logger.warning(f"LLM call failed ({reason}), retrying in {delay:.2f}s")
+        await asyncio.sleep(delay)
+
+
+@lru_cache()
+def get_llm_circuit_breaker() -> CircuitBreaker:
+    """Process-wide breaker shared by every LLMReasoningLayer."""
+    return CircuitBreaker(
+        failure_threshold=settings.llm_circuit_failure_threshold,
+        reset_timeout=settings.llm_circuit_reset_seconds
+    )
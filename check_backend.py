@@ -6,18 +6,39 @@ Tests if the backend is properly deployed and responding
 
 import requests
 import sys
+import time
 from datetime import datetime
 
 BACKEND_URL = "https://aadhar-t8uc.onrender.com"
 
-def check_health():
+def wait_ready(session, deadline_s=90, interval_s=2.0):
+    """Poll the health endpoint until the service answers or the deadline passes"""
+    print("⏳ Waiting for backend to wake up...")
+    start = time.monotonic()
+    
+    while time.monotonic() - start < deadline_s:
+        try:
+            # Any non-5xx answer means the app itself is serving requests;
+            # Render's proxy returns 5xx while an instance is still starting
+            response = session.head(f"{BACKEND_URL}/api/health", timeout=5)
+            if response.status_code < 500:
+                print(f"✅ Backend responded after {time.monotonic() - start:.1f}s\n")
+                return True
+        except requests.RequestException:
+            pass
+        time.sleep(interval_s)
+    
+    print(f"⚠️  No response within {deadline_s}s, trying anyway\n")
+    return False
+
+def check_health(session):
     """Check backend health endpoint"""
     print(f"🔍 Checking backend health: {BACKEND_URL}")
     print(f"⏰ Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
     
     try:
         print("📡 Making request to /api/health...")
-        response = requests.get(f"{BACKEND_URL}/api/health", timeout=60)
+        response = session.get(f"{BACKEND_URL}/api/health", timeout=60)
         
         print(f"✅ Status Code: {response.status_code}")
         print(f"✅ Response Time: {response.elapsed.total_seconds():.2f}s")
@@ -63,12 +84,12 @@ def check_health():
         print(f"\n❌ Unexpected error: {e}")
         return False
 
-def check_cors():
+def check_cors(session):
     """Check CORS headers"""
     print(f"\n\n🔒 Checking CORS configuration...")
     
     try:
-        response = requests.options(
+        response = session.options(
             f"{BACKEND_URL}/api/health",
             headers={
                 "Origin": "https://aadhar-ten.vercel.app",
@@ -103,8 +124,13 @@ def main():
     print("🏥 Aadhaar Pulse Backend Health Check")
     print("=" * 60)
     
-    health_ok = check_health()
-    cors_ok = check_cors()
+    # One session so the health check and CORS probe reuse the warm-up
+    # poll's TLS connection. The checks stay sequential so the report
+    # reads top to bottom.
+    with requests.Session() as session:
+        wait_ready(session)
+        health_ok = check_health(session)
+        cors_ok = check_cors(session)
     
     print("\n" + "=" * 60)
     if health_ok and cors_ok: